@@ -1,24 +1,36 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, Header, UploadFile, File
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from backend.models.schemas import (
     AnalyzeResumeRequest, AnalyzeResumeResponse,
-    MarketTrendsResponse, MarketTrendsResponseItem,
+    AnalyzeResumeBatchRequest, AnalyzeResumeBatchItem,
+    MarketTrendsResponse, MarketTrendsBatchRequest, MarketTrendsBatchResponse,
     GenerateRoadmapRequest, GenerateRoadmapResponse,
     ExplainRoadmapRequest, ExplainRoadmapResponse,
     ChatbotRequest, ChatbotResponse,
     TranslationRequest, TranslationResponse,
     RoleDiscoveryAnswersRequest, RoleDiscoveryResponse,
 )
-from backend.services.resume_parser import extract_skills, guess_current_role, extract_experience_years
-from backend.services.market_trend_service import compute_trending_skills, compute_market_statistics
+from backend.services.resume_parser import extract_skills, analyze_resume_text, analyze_resume_incremental, iter_resume_analyses
+from backend.services.resume_dedup import minhash_signature, near_duplicates
+from backend.services.analysis_cache import analysis_cache, content_hash as analysis_content_hash
+from backend.services.pdf_ingestion import ingest_pdf, spool_upload, remove_spooled, PdfTooLarge
+from backend.services.worker_pool import resume_pool, PoolSaturated
+from backend.services.career_catalog import get_catalog, thaw
+from backend.services.jsearch_client import jsearch_client
+from backend.services.market_cache import canonical_query, corpus_snapshot_cache, jsearch_cache
+from backend.services.market_trend_service import snapshot_flight
+from backend.services.market_scheduler import market_scheduler
 from backend.services.roadmap_generator import generate_roadmap
 from backend.services.llm_service import explain_roadmap
 from backend.utils.db import get_db
 from backend.utils.security import decode_token
 from backend.api.auth_routes import get_current_user
+from backend.utils.settings import settings
 from datetime import datetime
+from collections import Counter
+import asyncio
 from bson import ObjectId
-import pdfplumber
-import io
 
 router = APIRouter()
 
@@ -42,6 +54,27 @@ def _skill_matches(required_skill: str, current_skills: list[str]) -> bool:
             return True
     return False
 
+def _user_id_from_authorization(authorization: str | None) -> str | None:
+    """User id from an optional bearer token; None for anonymous or invalid tokens."""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    payload_decoded = decode_token(authorization.split(" ", 1)[1])
+    if payload_decoded and payload_decoded.get("sub"):
+        return payload_decoded["sub"]
+    return None
+
+
+def _persist_analysis(user_id: str, doc: dict) -> None:
+    """Best-effort insert into the analyses collection."""
+    try:
+        col = get_db()["analyses"]
+        col.create_index([("user_id", 1), ("created_at", -1)])
+        col.create_index("content_hash")
+        col.insert_one({"user_id": user_id, **doc, "created_at": datetime.utcnow()})
+    except Exception:
+        pass
+
+
 @router.get("/ping")
 def ping():
     return {"status": "ok"}
@@ -60,97 +93,156 @@ async def upload_resume(
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
+    pdf_path = None
     try:
-        # Read PDF content
-        pdf_bytes = await file.read()
-        resume_text = ""
-        
-        # Extract text from PDF using pdfplumber
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    resume_text += text + "\n"
-        
+        # Hand the upload to the workers as a file on disk (size capped on receipt)
+        pdf_path = await spool_upload(file, settings.PDF_MAX_BYTES)
+
+        # Parse pages and analyze in worker processes so the event loop stays free
+        resume_text = await ingest_pdf(pdf_path, resume_pool)
+
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
         
-        # Analyze the resume
-        skills = extract_skills(resume_text)
-        role = guess_current_role(resume_text)
-        years = extract_experience_years(resume_text)
-        
-        resp = AnalyzeResumeResponse(
-            skills=skills,
-            current_role=role,
-            experience_years=years,
-            education=None
-        )
+        # Analyze the resume (cached by content hash; near-duplicates of the
+        # user's earlier resumes only re-scan the sections that changed)
+        user_id = _user_id_from_authorization(authorization)
+        content_hash = analysis_content_hash(resume_text)
+        analysis = await run_in_threadpool(analysis_cache.get, content_hash)
+        extra = {}
+        if analysis is None:
+            if user_id:
+                signature = await run_in_threadpool(minhash_signature, resume_text)
+                previous = await run_in_threadpool(near_duplicates.lookup, user_id, signature)
+                result = await resume_pool.run(analyze_resume_incremental, resume_text, previous)
+                analysis = result["analysis"]
+                near_duplicates.add(user_id, signature, result["sections"])
+                extra = {"minhash": signature, "sections": result["sections"]}
+            else:
+                analysis = await resume_pool.run(analyze_resume_text, resume_text)
+            analysis_cache.put(content_hash, analysis)
+        resp = AnalyzeResumeResponse(**analysis)
         
         # Try to persist if user provided
-        try:
-            if authorization and authorization.lower().startswith("bearer "):
-                payload_token = authorization.split(" ", 1)[1]
-                payload_decoded = decode_token(payload_token)
-                if payload_decoded and payload_decoded.get("sub"):
-                    db = get_db()
-                    col = db["analyses"]
-                    col.create_index([("user_id", 1), ("created_at", -1)])
-                    col.insert_one({
-                        "user_id": payload_decoded["sub"],
-                        "analysis": resp.model_dump(),
-                        "resume_text": resume_text,
-                        "created_at": datetime.utcnow(),
-                    })
-        except Exception:
-            pass
-        
+        if user_id:
+            await run_in_threadpool(_persist_analysis, user_id, {
+                "analysis": resp.model_dump(),
+                "content_hash": content_hash,
+                "resume_text": resume_text,
+                **extra,
+            })
         return resp
         
+    except PdfTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except PoolSaturated:
+        raise HTTPException(
+            status_code=503,
+            detail="Resume processing is at capacity, please retry shortly",
+            headers={"Retry-After": str(settings.RESUME_RETRY_AFTER_SECONDS)},
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
+    finally:
+        if pdf_path:
+            remove_spooled(pdf_path)
 
 
 @router.post("/analyze_resume", response_model=AnalyzeResumeResponse)
 def analyze_resume(payload: AnalyzeResumeRequest, authorization: str | None = Header(default=None)):
     if not payload.resume_text.strip():
         raise HTTPException(status_code=400, detail="resume_text is required")
-    skills = extract_skills(payload.resume_text)
-    role = guess_current_role(payload.resume_text)
-    years = extract_experience_years(payload.resume_text)
-    resp = AnalyzeResumeResponse(skills=skills, current_role=role, experience_years=years, education=None)
+    user_id = _user_id_from_authorization(authorization)
+    content_hash = analysis_content_hash(payload.resume_text)
+    analysis = analysis_cache.get(content_hash)
+    extra = {}
+    if analysis is None:
+        if user_id:
+            # reuse unchanged sections of the user's near-duplicate resume, if any
+            signature = minhash_signature(payload.resume_text)
+            result = analyze_resume_incremental(payload.resume_text, near_duplicates.lookup(user_id, signature))
+            analysis = result["analysis"]
+            near_duplicates.add(user_id, signature, result["sections"])
+            extra = {"minhash": signature, "sections": result["sections"]}
+        else:
+            analysis = analyze_resume_text(payload.resume_text)
+        analysis_cache.put(content_hash, analysis)
+    resp = AnalyzeResumeResponse(**analysis)
     # Try to persist if user provided
-    try:
-        if authorization and authorization.lower().startswith("bearer "):
-            payload_token = authorization.split(" ", 1)[1]
-            payload_decoded = decode_token(payload_token)
-            if payload_decoded and payload_decoded.get("sub"):
-                db = get_db()
-                col = db["analyses"]
-                col.create_index([("user_id", 1), ("created_at", -1)])
-                col.insert_one({
-                    "user_id": payload_decoded["sub"],
-                    "analysis": resp.model_dump(),
-                    "created_at": datetime.utcnow(),
-                })
-    except Exception:
-        pass
+    if user_id:
+        _persist_analysis(user_id, {"analysis": resp.model_dump(), "content_hash": content_hash, **extra})
     return resp
 
 
+@router.post("/analyze_resume/batch")
+def analyze_resume_batch(payload: AnalyzeResumeBatchRequest):
+    """
+    Analyze many resumes in one call (e.g. a whole bootcamp cohort).
+    Results stream back as NDJSON, one AnalyzeResumeBatchItem per line, as each chunk completes.
+    """
+    texts = payload.resume_texts
+    if not texts:
+        raise HTTPException(status_code=400, detail="resume_texts is required")
+    if len(texts) > settings.RESUME_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.RESUME_BATCH_MAX_ITEMS} resumes per batch")
+
+    def stream():
+        valid = [i for i, t in enumerate(texts) if t.strip()]
+        for i in sorted(set(range(len(texts))) - set(valid)):
+            yield AnalyzeResumeBatchItem(index=i, error="resume_text is required").model_dump_json() + "\n"
+        for pos, analysis in iter_resume_analyses([texts[i] for i in valid], chunk_size=settings.RESUME_BATCH_CHUNK_SIZE):
+            yield AnalyzeResumeBatchItem(index=valid[pos], **analysis).model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/market_trends", response_model=MarketTrendsResponse)
-def market_trends(role: str = Query(...), location: str = Query("") ):
-    items = compute_trending_skills(role, location)
-    stats = compute_market_statistics(role, location)
-    response_data = MarketTrendsResponse(trending_skills=[MarketTrendsResponseItem(**i) for i in items])
-    # Add statistics to response
-    response_dict = response_data.model_dump()
-    response_dict.update(stats)
-    return response_dict
+async def market_trends(role: str = Query(...), location: str = Query("") ):
+    # precomputed for catalog roles; otherwise one fetch feeds both trends and statistics
+    return MarketTrendsResponse(**await market_scheduler.snapshot(role, location))
+
+
+@router.post("/market_trends/batch", response_model=MarketTrendsBatchResponse)
+async def market_trends_batch(payload: MarketTrendsBatchRequest):
+    """Trends for several roles at once, computed concurrently (e.g. all dashboard cards)."""
+    queries = payload.queries
+    if not queries:
+        raise HTTPException(status_code=400, detail="queries is required")
+    if len(queries) > settings.MARKET_BATCH_MAX_QUERIES:
+        raise HTTPException(status_code=400, detail=f"At most {settings.MARKET_BATCH_MAX_QUERIES} queries per batch")
+
+    # identical canonical queries are computed once; different ones run concurrently. The
+    # canonical key only deduplicates: snapshot() gets the query as asked, like GET /market_trends
+    first = {}
+    for q in queries:
+        first.setdefault(canonical_query(q.role, q.location), q)
+    unique = list(first)
+    snapshots = dict(zip(unique, await asyncio.gather(
+        *(market_scheduler.snapshot(first[key].role, first[key].location) for key in unique)
+    )))
+
+    # key by role as asked for; "<role> in <location>" only when a role comes with several locations
+    locations_per_role = Counter(role for role, _ in unique)
+    labels = {}
+    for q in queries:
+        key = canonical_query(q.role, q.location)
+        if key not in labels:
+            role = " ".join(q.role.split())
+            labels[key] = role if locations_per_role[key[0]] == 1 else f"{role} in {' '.join(q.location.split()) or 'any location'}"
+    results = {label: MarketTrendsResponse(**snapshots[key]) for key, label in labels.items()}
+    return MarketTrendsBatchResponse(results=results)
 
 
 @router.post("/generate_roadmap", response_model=GenerateRoadmapResponse)
-def generate_roadmap_endpoint(payload: GenerateRoadmapRequest):
+async def generate_roadmap_endpoint(payload: GenerateRoadmapRequest):
+    # Fetch market trends to weight roadmap
+    trends = (await market_scheduler.snapshot(payload.target_role, payload.location or ""))["trending_skills"]
+    return await run_in_threadpool(_build_roadmap_response, payload, trends)
+
+
+def _build_roadmap_response(payload: GenerateRoadmapRequest, trends: list[dict]) -> GenerateRoadmapResponse:
     # Determine current_skills
     current_skills = payload.current_skills
     if (not current_skills) and payload.resume_text:
@@ -158,8 +250,6 @@ def generate_roadmap_endpoint(payload: GenerateRoadmapRequest):
     if not current_skills:
         current_skills = []
 
-    # Fetch market trends to weight roadmap
-    trends = compute_trending_skills(payload.target_role, payload.location or "")
     data = generate_roadmap(current_skills, payload.target_role, trends)
 
     # Compute readiness metrics
@@ -249,6 +339,24 @@ def latest_analysis(current_user=Depends(get_current_user)):
     return AnalyzeResumeResponse(**data)
 
 
+@router.get("/analyses/cache_stats")
+def analysis_cache_stats(current_user=Depends(get_current_user)):
+    """Hit/miss counters of the resume analysis cache, for sizing ANALYSIS_CACHE_SIZE."""
+    return analysis_cache.stats()
+
+
+@router.get("/market_trends/cache_stats")
+def market_cache_stats(current_user=Depends(get_current_user)):
+    """Fresh/stale/miss counters of the JSearch page cache and request coalescing."""
+    return {
+        **jsearch_cache.stats(),
+        "coalescing": snapshot_flight.stats(),
+        "corpus_snapshots": corpus_snapshot_cache.stats(),
+        "precompute": market_scheduler.stats(),
+        "provider": {"quota": jsearch_client.budget.stats(), "breaker": jsearch_client.breaker.stats()},
+    }
+
+
 @router.post("/explain_roadmap", response_model=ExplainRoadmapResponse)
 def explain_roadmap_endpoint(payload: ExplainRoadmapRequest):
     result = explain_roadmap(payload.roadmap.model_dump())
@@ -258,24 +366,17 @@ def explain_roadmap_endpoint(payload: ExplainRoadmapRequest):
 @router.get("/courses")
 def get_all_courses(role: str = Query(None)):
     """Get all courses or filter by role"""
-    from pathlib import Path
-    import json
-    
-    data_dir = Path(__file__).parent.parent / "data"
-    courses_path = data_dir / "courses_database.json"
-    
     try:
-        with open(courses_path, "r", encoding="utf-8") as f:
-            courses_db = json.load(f)
+        courses_db = get_catalog().courses_by_role
         
         if role:
-            return {"courses": courses_db.get(role, [])}
+            return {"courses": thaw(courses_db.get(role, ()))}
         
         # Return all courses from all roles
         all_courses = []
         for role_name, courses in courses_db.items():
             for course in courses:
-                course_with_role = course.copy()
+                course_with_role = thaw(course)
                 course_with_role["role"] = role_name
                 all_courses.append(course_with_role)
         
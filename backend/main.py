@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -5,8 +7,22 @@ from backend.utils.settings import settings
 from backend.api.routes import router as api_router
 from backend.api.auth_routes import router as auth_router
 from backend.api.progress_routes import router as progress_router
+from backend.services.worker_pool import resume_pool
+from backend.services.pdf_ingestion import UploadSizeLimitMiddleware
+from backend.services.jsearch_client import jsearch_client
+from backend.services.market_scheduler import market_scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    market_scheduler.start()
+    yield
+    await market_scheduler.stop()
+    resume_pool.shutdown()
+    await jsearch_client.aclose()
 
-app = FastAPI(title="CareerAI Backend", version="0.1.0")
+
+app = FastAPI(title="CareerAI Backend", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,6 +33,9 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# refuse oversized resume uploads before Starlette spools the multipart body
+app.add_middleware(UploadSizeLimitMiddleware, paths=["/api/upload_resume"], max_bytes=settings.PDF_MAX_BYTES)
+
 app.include_router(api_router, prefix="/api")
 app.include_router(auth_router, prefix="/api")
 app.include_router(progress_router, prefix="/api")
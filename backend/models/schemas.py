@@ -10,13 +10,48 @@ class AnalyzeResumeResponse(BaseModel):
     experience_years: Optional[int] = None
     education: Optional[List[str]] = None
 
+class AnalyzeResumeBatchRequest(BaseModel):
+    resume_texts: List[str] = Field(..., description="Raw resume texts to analyze in one request")
+
+class AnalyzeResumeBatchItem(AnalyzeResumeResponse):
+    index: int = Field(..., description="Position of the resume in the request")
+    skills: List[str] = []
+    error: Optional[str] = None
+
 class MarketTrendsResponseItem(BaseModel):
     name: str
     importance: float
     job_count: int
 
+class CooccurringSkill(BaseModel):
+    name: str
+    job_count: int
+    share: float = Field(..., description="Fraction of the skill's postings that also request this one")
+
 class MarketTrendsResponse(BaseModel):
     trending_skills: List[MarketTrendsResponseItem]
+    skill_cooccurrence: Dict[str, List[CooccurringSkill]] = {}
+    skills_by_location: Dict[str, List[str]] = {}
+    job_openings: Optional[int] = None
+    avg_salary: Optional[int] = None
+    growth_rate: Optional[float] = None
+    remote_percentage: Optional[int] = None
+    top_companies: List[str] = []
+    top_locations: List[str] = []
+    canonical_role: Optional[str] = Field(None, description="Catalog role the query was normalized to")
+    canonical_location: Optional[str] = Field(None, description="Canonical location the query was normalized to")
+
+class MarketTrendsQuery(BaseModel):
+    role: str
+    location: str = ""
+
+class MarketTrendsBatchRequest(BaseModel):
+    queries: List[MarketTrendsQuery] = Field(..., description="(role, location) pairs, e.g. one per dashboard card")
+
+class MarketTrendsBatchResponse(BaseModel):
+    results: Dict[str, MarketTrendsResponse] = Field(
+        ..., description="Keyed by role; by '<role> in <location>' when a role is asked for several locations"
+    )
 
 class GenerateRoadmapRequest(BaseModel):
     current_skills: Optional[List[str]] = None
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Dict, Optional
+from collections import OrderedDict
+import copy
+import hashlib
+import threading
+
+from backend.services.resume_parser import ANALYZER_REVISION, SKILLS_DB_VERSION, normalize
+from backend.utils.db import get_db
+from backend.utils.settings import settings
+
+
+def content_hash(resume_text: str) -> str:
+    """Key an analysis by its normalized text and the catalog/analyzer/threshold it was computed with."""
+    version = f"{SKILLS_DB_VERSION}:{ANALYZER_REVISION}:{settings.SKILL_FUZZY_THRESHOLD:g}"
+    payload = f"{version}\n{normalize(resume_text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class AnalysisCache:
+    """LRU of resume analyses, backed by the ``analyses`` Mongo collection.
+
+    Lookups try the in-process LRU first, then any stored analysis with the
+    same ``content_hash``. Counters are kept so the LRU can be sized.
+    """
+
+    def __init__(self, maxsize: int = 2048, collection: str = "analyses") -> None:
+        self.maxsize = maxsize
+        self.collection = collection
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def _load_from_store(self, key: str) -> Optional[dict]:
+        if not settings.MONGODB_URI:
+            return None
+        try:
+            rec = get_db()[self.collection].find_one(
+                {"content_hash": key}, {"analysis": 1}, sort=[("created_at", -1)]
+            )
+        except Exception:
+            return None
+        return rec.get("analysis") if rec else None
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(analysis)
+        analysis = self._load_from_store(key)
+        with self._lock:
+            if analysis is None:
+                self.misses += 1
+                return None
+            self.store_hits += 1
+        self.put(key, analysis)
+        return copy.deepcopy(analysis)
+
+    def put(self, key: str, analysis: dict) -> None:
+        with self._lock:
+            self._entries[key] = copy.deepcopy(analysis)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.store_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.store_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+analysis_cache = AnalysisCache(maxsize=settings.ANALYSIS_CACHE_SIZE)
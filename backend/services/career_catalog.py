@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from pathlib import Path
+from types import MappingProxyType
+import hashlib
+import json
+import threading
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of parsed JSON: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain (mutable, JSON-ready) copy of a catalog value, for responses."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def skill_id(name: str) -> str:
+    """Case- and whitespace-insensitive key of a skill (or role) name."""
+    return " ".join((name or "").lower().split())
+
+
+class CareerCatalog:
+    """Skills, roles and courses from ``backend/data``, parsed once and shared.
+
+    Everything is read-only (mapping proxies and tuples), so services can
+    hold references without copying. Indexes:
+
+    * ``roles_by_name``: role entry by name; for roles listed twice in
+      roles_skills.json the last entry wins, as the chatbot and role
+      discovery always resolved them;
+    * ``roles_by_key``: role entry by lowercase name, first entry winning,
+      as roadmap generation always resolved them;
+    * ``courses_by_role``: courses per role name.
+    """
+
+    def __init__(self, skills: Sequence[str], roles: Sequence[dict], courses: Dict[str, List[dict]],
+                 skills_version: str = "") -> None:
+        self.skills: Tuple[str, ...] = tuple(skills)
+        self.skills_version = skills_version
+
+        by_name: Dict[str, Mapping[str, Any]] = {}
+        by_key: Dict[str, Mapping[str, Any]] = {}
+        for entry in roles:
+            if entry.get("role"):
+                frozen = _freeze(entry)
+                by_name[entry["role"]] = frozen
+                by_key.setdefault(skill_id(entry["role"]), frozen)
+        self.roles_by_name: Mapping[str, Mapping[str, Any]] = MappingProxyType(by_name)
+        self.roles: Tuple[Mapping[str, Any], ...] = tuple(by_name.values())
+        self.role_names: Tuple[str, ...] = tuple(by_name)
+        self.roles_by_key: Mapping[str, Mapping[str, Any]] = MappingProxyType(by_key)
+        self.required_skills_by_role: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {name: entry.get("required_skills", ()) for name, entry in by_name.items()}
+        )
+
+        self.courses_by_role: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType(
+            {role: _freeze(list(items)) for role, items in courses.items()}
+        )
+
+    @classmethod
+    def load(cls, data_dir: Path = DATA_DIR) -> "CareerCatalog":
+        skills_raw = (data_dir / "skills_database.json").read_bytes()
+        with open(data_dir / "roles_skills.json", "r", encoding="utf-8") as f:
+            roles = json.load(f)
+        try:
+            with open(data_dir / "courses_database.json", "r", encoding="utf-8") as f:
+                courses = json.load(f)
+        except FileNotFoundError:
+            courses = {}
+        return cls(
+            json.loads(skills_raw), roles, courses,
+            # bumps whenever skills_database.json changes, invalidating cached analyses
+            skills_version=hashlib.sha256(skills_raw).hexdigest()[:12],
+        )
+
+    def role(self, name: str) -> Optional[Mapping[str, Any]]:
+        return self.roles_by_key.get(skill_id(name))
+
+    def required_skills(self, role: str) -> Tuple[str, ...]:
+        entry = self.role(role)
+        return entry.get("required_skills", ()) if entry else ()
+
+    def courses_for_role(self, role: str) -> Tuple[Mapping[str, Any], ...]:
+        return self.courses_by_role.get(role, ())
+
+
+_catalog: Optional[CareerCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> CareerCatalog:
+    """The process-wide catalog, loaded on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = CareerCatalog.load()
+    return _catalog
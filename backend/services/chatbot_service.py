@@ -1,8 +1,8 @@
 import google.generativeai as genai
-from pathlib import Path
-import json
 from typing import Dict, Any
 
+from backend.services.career_catalog import get_catalog, thaw
+
 class ChatbotService:
     def __init__(self, api_key: str):
         """Initialize the Gemini chatbot service."""
@@ -40,31 +40,13 @@ class ChatbotService:
         self.context = self._load_application_context()
     
     def _load_application_context(self) -> str:
-        """Load application context from data files."""
+        """Build application context from the shared career catalog."""
         try:
-            base_path = Path(__file__).parent.parent / "data"
-            
-            # Load courses database
-            with open(base_path / "courses_database.json", "r") as f:
-                courses_data = json.load(f)
-            
-            # Load skills database
-            with open(base_path / "skills_database.json", "r") as f:
-                skills_data = json.load(f)
-            
-            # Load roles and skills mapping
-            with open(base_path / "roles_skills.json", "r") as f:
-                raw_roles_data = json.load(f)
-            
-            # Normalize roles_data to dict format
-            if isinstance(raw_roles_data, list):
-                roles_data = {}
-                for item in raw_roles_data:
-                    role_name = item.get("role")
-                    if role_name:
-                        roles_data[role_name] = item.get("required_skills", [])
-            else:
-                roles_data = raw_roles_data
+            catalog = get_catalog()
+            courses_data = catalog.courses_by_role
+            skills_data = catalog.skills
+            # role name -> required skills
+            roles_data = catalog.required_skills_by_role
             
             # Expose structured data for fallbacks
             self.courses_data = courses_data
@@ -73,7 +55,7 @@ class ChatbotService:
 
             # Create optimized context string - don't overwhelm with ALL data
             all_roles_list = list(courses_data.keys())
-            all_skills_list = list(skills_data) if isinstance(skills_data, list) else list(skills_data.keys())
+            all_skills_list = list(skills_data)
             
             # Sample representative roles from each category
             tech_roles = [r for r in roles_data.keys() if "developer" in r.lower() or "engineer" in r.lower() or "data" in r.lower() or "ml" in r.lower() or "cloud" in r.lower()][:10]
@@ -384,15 +366,13 @@ Provide a helpful answer about the role mentioned in the question. Be specific a
     def get_course_recommendations(self, role: str) -> Dict[str, Any]:
         """Get course recommendations for a specific role."""
         try:
-            base_path = Path(__file__).parent.parent / "data"
-            with open(base_path / "courses_database.json", "r") as f:
-                courses_data = json.load(f)
+            courses_data = get_catalog().courses_by_role
             
             if role in courses_data:
                 return {
                     "success": True,
                     "role": role,
-                    "courses": courses_data[role]
+                    "courses": thaw(courses_data[role])
                 }
             else:
                 return {
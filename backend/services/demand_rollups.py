@@ -0,0 +1,198 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from backend.services.job_corpus import query_key
+from backend.utils.db import get_db
+from backend.utils.settings import settings
+
+# fixed reference time for decayed scores (see DemandRollups)
+DECAY_EPOCH = datetime(2024, 1, 1)
+
+
+def encode_key(key: str) -> str:
+    """Make a skill name safe as a Mongo field name ("node.js" -> "node%2Ejs")."""
+    return key.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+
+def decode_key(key: str) -> str:
+    return key.replace("%24", "$").replace("%2E", ".").replace("%25", "%")
+
+
+class DemandRollups:
+    """Incremental skill-demand rollups per canonical (role, location) query.
+
+    Every posting new to a query is folded in once, as it is ingested:
+
+    * ``skill_rollups_daily`` gets one document per query and posting day with
+      the posting count; growth is read from it, and a TTL index drops days
+      once they leave both growth windows;
+    * ``skill_demand`` keeps one summary document per query with all-time
+      skill counts, exponentially decayed skill scores, and the time the
+      query was first ingested.
+
+    Decayed scores are stored per era of ``ERA_HALF_LIVES`` half-lives since
+    ``DECAY_EPOCH``: a posting at time ``t`` adds ``2 ** ((t - era_start) /
+    half_life)`` to its era, and reads scale each era by ``2 ** (-(now -
+    era_start) / half_life)``. Updates are then plain ``$inc``s (atomic, no
+    read-modify-write), weights stay below ``2 ** ERA_HALF_LIVES`` for any
+    half-life, and eras older than the previous one, whose weight has decayed
+    to nothing, are dropped.
+    """
+
+    ERA_HALF_LIVES = 256
+
+    def __init__(self, half_life_days: float = 14.0, growth_window_days: int = 30,
+                 daily_collection: str = "skill_rollups_daily", summary_collection: str = "skill_demand") -> None:
+        if half_life_days <= 0:
+            raise ValueError(f"half_life_days must be positive, got {half_life_days}")
+        self.half_life_days = half_life_days
+        self.growth_window_days = growth_window_days
+        self.daily_collection = daily_collection
+        self.summary_collection = summary_collection
+        self._era_days = half_life_days * self.ERA_HALF_LIVES
+
+    @staticmethod
+    def _days(when: datetime) -> float:
+        return (when - DECAY_EPOCH).total_seconds() / 86400.0
+
+    def _era(self, when: datetime) -> int:
+        return int(self._days(when) // self._era_days)
+
+    def _weight(self, when: datetime, era: int) -> float:
+        return 2.0 ** ((self._days(when) - era * self._era_days) / self.half_life_days)
+
+    def record(self, role: str, location: str, postings: Iterable[Tuple[datetime, Set[str]]]) -> int:
+        """Fold ``(posted_at, skills)`` of postings new to the query into the rollups."""
+        if not settings.MONGODB_URI:
+            return 0
+        now = datetime.utcnow()
+        current = self._era(now)
+        qkey = query_key(role, location)
+        day_postings: Counter = Counter()
+        counts: Counter = Counter()
+        scores: Dict[str, float] = defaultdict(float)
+        n = 0
+        for posted_at, skills in postings:
+            n += 1
+            day_postings[posted_at.strftime("%Y-%m-%d")] += 1
+            era = self._era(posted_at)
+            # anything older than the previous era has decayed to nothing
+            weight = self._weight(posted_at, era) if era >= current - 1 else 0.0
+            for skill in skills:
+                key = encode_key(skill)
+                counts[key] += 1
+                if weight:
+                    scores[f"{era}.{key}"] += weight
+        if not n:
+            return 0
+        oldest_day = (now - timedelta(days=2 * self.growth_window_days)).strftime("%Y-%m-%d")
+        try:
+            db = get_db()
+            daily = db[self.daily_collection]
+            daily.create_index([("query", 1), ("day", 1)], unique=True)
+            daily.create_index("date", expireAfterSeconds=(2 * self.growth_window_days + 1) * 86400)
+            for day, postings_that_day in day_postings.items():
+                if day < oldest_day:
+                    continue
+                daily.update_one(
+                    {"query": qkey, "day": day},
+                    {"$inc": {"postings": postings_that_day},
+                     "$setOnInsert": {"date": datetime.strptime(day, "%Y-%m-%d")}},
+                    upsert=True,
+                )
+
+            inc = {"postings": n}
+            inc.update({f"counts.{k}": v for k, v in counts.items()})
+            inc.update({f"decayed.{k}": v for k, v in scores.items()})
+            summary = db[self.summary_collection]
+            summary.create_index("query", unique=True)
+            summary.update_one(
+                {"query": qkey},
+                {"$inc": inc, "$min": {"first_ingested_at": now}, "$set": {"updated_at": now}},
+                upsert=True,
+            )
+        except Exception:
+            return 0
+        return n
+
+    def _growth_rate(self, summary: dict, by_day: Dict[str, int], now: datetime) -> Optional[float]:
+        """Percent change in postings between the last two growth windows.
+
+        ``None`` until the query has been ingested for both windows: postings
+        dated before the first ingestion (a fetch returns a few weeks of
+        backlog) do not make the prior window complete.
+        """
+        window = self.growth_window_days
+        first_ingested_at = summary.get("first_ingested_at")
+        if not first_ingested_at or first_ingested_at > now - timedelta(days=2 * window):
+            return None
+        recent_start = (now - timedelta(days=window)).strftime("%Y-%m-%d")
+        prior_start = (now - timedelta(days=2 * window)).strftime("%Y-%m-%d")
+        recent = sum(v for d, v in by_day.items() if d > recent_start)
+        prior = sum(v for d, v in by_day.items() if prior_start < d <= recent_start)
+        if not prior:
+            return None
+        return round((recent - prior) / prior * 100, 1)
+
+    def _postings_by_day(self, qkey: str, now: datetime) -> Dict[str, int]:
+        since = (now - timedelta(days=2 * self.growth_window_days)).strftime("%Y-%m-%d")
+        cursor = get_db()[self.daily_collection].find(
+            {"query": qkey, "day": {"$gt": since}}, {"_id": 0, "day": 1, "postings": 1}
+        )
+        return {doc["day"]: doc.get("postings", 0) for doc in cursor}
+
+    def _decayed_scores(self, summary: dict, now: datetime) -> Dict[str, float]:
+        current = self._era(now)
+        scores: Dict[str, float] = defaultdict(float)
+        stale = []
+        for era, values in summary.get("decayed", {}).items():
+            if int(era) < current - 1:
+                stale.append(era)
+                continue
+            scale = 2.0 ** (-(self._days(now) - int(era) * self._era_days) / self.half_life_days)
+            for key, value in values.items():
+                scores[decode_key(key)] += value * scale
+        if stale:
+            try:
+                get_db()[self.summary_collection].update_one(
+                    {"_id": summary["_id"]}, {"$unset": {f"decayed.{era}": "" for era in stale}}
+                )
+            except Exception:
+                pass
+        return scores
+
+    def read(self, role: str, location: str, limit: int = 25) -> Optional[dict]:
+        """Decayed trending skills and growth rate of a query (``None`` without a rollup)."""
+        if not settings.MONGODB_URI:
+            return None
+        qkey = query_key(role, location)
+        now = datetime.utcnow()
+        try:
+            summary = get_db()[self.summary_collection].find_one({"query": qkey})
+            by_day = self._postings_by_day(qkey, now) if summary else {}
+        except Exception:
+            return None
+        if not summary:
+            return None
+        scores = self._decayed_scores(summary, now)
+        counts = {decode_key(k): v for k, v in summary.get("counts", {}).items()}
+        ranked: List[Tuple[str, float]] = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        top = ranked[0][1] if ranked and ranked[0][1] > 0 else 0.0
+        trending = [
+            {"name": skill.title(), "importance": round(score / top, 3) if top else 0.0,
+             "job_count": int(counts.get(skill, 0))}
+            for skill, score in ranked
+        ]
+        return {
+            "trending_skills": trending,
+            "growth_rate": self._growth_rate(summary, by_day, now),
+            "postings": summary.get("postings", 0),
+        }
+
+
+demand_rollups = DemandRollups(
+    half_life_days=settings.MARKET_DEMAND_HALF_LIFE_DAYS,
+    growth_window_days=settings.MARKET_GROWTH_WINDOW_DAYS,
+)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime, timedelta
+import hashlib
+import threading
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from backend.services.market_cache import canonical_query
+from backend.utils.db import get_db
+from backend.utils.settings import settings
+
+# JSearch fields kept per posting; trends and statistics read the same names
+_POSTING_FIELDS = (
+    "job_title", "job_description", "employer_name", "job_city", "job_state",
+    "job_country", "job_is_remote", "job_min_salary", "job_max_salary",
+    "job_salary_period", "job_highlights", "job_posted_at_timestamp",
+)
+
+
+def job_key(item: dict) -> str:
+    """Provider job id, or a content hash for items that lack one."""
+    if item.get("job_id"):
+        return str(item["job_id"])
+    basis = "|".join(str(item.get(k) or "") for k in ("job_title", "employer_name", "job_city", "job_state"))
+    return "sha1:" + hashlib.sha1(basis.lower().encode("utf-8")).hexdigest()
+
+
+def query_key(role: str, location: str) -> str:
+    return "|".join(canonical_query(role, location))
+
+
+class JobPostingCorpus:
+    """Postings accumulated across JSearch fetches in the ``job_postings`` collection.
+
+    Each posting is stored once under its provider ``job_id`` and tagged with
+    every canonical (role, location) query that returned it. Ingestion only
+    inserts postings not seen before (seen ones just get ``last_seen_at``
+    bumped), and trends are computed from the postings of a query published
+    within the recency window. Each posting also stores the catalog skills
+    matched in it at ingestion, so trends never re-match stored postings.
+    Without MONGODB_URI every method is a no-op.
+
+    ``generation`` counts, per query, the ingests that added postings to it
+    in this process; snapshots built from the corpus are cached against it.
+    """
+
+    def __init__(self, collection: str = "job_postings", window_days: int = 30,
+                 max_postings: int = 2000) -> None:
+        self.collection = collection
+        self.window_days = window_days
+        self.max_postings = max_postings
+        self._indexed = False
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+
+    def _col(self):
+        col = get_db()[self.collection]
+        with self._lock:
+            if not self._indexed:
+                col.create_index("job_id", unique=True)
+                col.create_index([("queries", 1), ("posted_at", -1)])
+                self._indexed = True
+        return col
+
+    @staticmethod
+    def _document(item: dict, key: str, qkey: str, now: datetime) -> dict:
+        doc = {field: item.get(field) for field in _POSTING_FIELDS if item.get(field) is not None}
+        ts = item.get("job_posted_at_timestamp")
+        try:
+            posted_at = datetime.utcfromtimestamp(int(ts)) if ts else now
+        except (TypeError, ValueError, OverflowError):
+            posted_at = now
+        doc.update({
+            "job_id": key,
+            "queries": [qkey],
+            "posted_at": posted_at,
+            "first_seen_at": now,
+            "last_seen_at": now,
+        })
+        return doc
+
+    def generation(self, role: str, location: str) -> int:
+        return self._generations.get(query_key(role, location), 0)
+
+    def _bump(self, qkey: str, postings: List[dict]) -> List[dict]:
+        if postings:
+            with self._lock:
+                self._generations[qkey] = self._generations.get(qkey, 0) + 1
+        return postings
+
+    def has_postings(self, role: str, location: str) -> bool:
+        if not settings.MONGODB_URI:
+            return False
+        try:
+            return self._col().find_one({"queries": query_key(role, location)}, {"_id": 1}) is not None
+        except Exception:
+            return False
+
+    def ingest(self, role: str, location: str, items: Iterable[dict]) -> List[dict]:
+        """Store postings not seen before; return the postings new to this query."""
+        if not settings.MONGODB_URI:
+            return []
+        now = datetime.utcnow()
+        qkey = query_key(role, location)
+        docs = {}
+        for item in items:
+            key = job_key(item)
+            docs[key] = self._document(item, key, qkey, now)
+        if not docs:
+            return []
+        new: List[dict] = []
+        retagged: List[dict] = []
+        try:
+            col = self._col()
+            seen = {
+                d["job_id"]: d.get("queries", [])
+                for d in col.find({"job_id": {"$in": list(docs)}}, {"job_id": 1, "queries": 1})
+            }
+            if seen:
+                col.update_many(
+                    {"job_id": {"$in": list(seen)}},
+                    {"$set": {"last_seen_at": now}, "$addToSet": {"queries": qkey}},
+                )
+            retagged = [doc for key, doc in docs.items() if key in seen and qkey not in seen[key]]
+            new = [doc for key, doc in docs.items() if key not in seen]
+            if new:
+                # insert_many adds _id to the dicts; keep the returned postings clean
+                col.insert_many([dict(doc) for doc in new], ordered=False)
+            return self._bump(qkey, retagged + new)
+        except BulkWriteError as e:
+            # a concurrent ingest stored some of them first
+            failed = {err.get("index") for err in e.details.get("writeErrors", [])}
+            return self._bump(qkey, retagged + [doc for i, doc in enumerate(new) if i not in failed])
+        except Exception:
+            return []
+
+    def set_skills(self, skills_by_job: Dict[str, Iterable[str]], version: str) -> None:
+        """Store the matched skills of postings (and the skills DB version they were matched with)."""
+        if not settings.MONGODB_URI or not skills_by_job:
+            return
+        try:
+            self._col().bulk_write([
+                UpdateOne({"job_id": key}, {"$set": {"skills": sorted(skills), "skills_version": version}})
+                for key, skills in skills_by_job.items()
+            ], ordered=False)
+        except Exception:
+            pass
+
+    def recent(self, role: str, location: str) -> Optional[List[dict]]:
+        """Postings of a query within the recency window, newest first (``None`` if unavailable)."""
+        if not settings.MONGODB_URI:
+            return None
+        cutoff = datetime.utcnow() - timedelta(days=self.window_days)
+        try:
+            cursor = self._col().find(
+                {"queries": query_key(role, location), "posted_at": {"$gte": cutoff}},
+                {"_id": 0, "queries": 0},
+            ).sort("posted_at", -1).limit(self.max_postings)
+            return list(cursor)
+        except Exception:
+            return None
+
+
+job_corpus = JobPostingCorpus(
+    window_days=settings.MARKET_CORPUS_WINDOW_DAYS,
+    max_postings=settings.MARKET_CORPUS_MAX_POSTINGS,
+)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import Dict, List, Optional
+import asyncio
+import importlib.util
+
+import httpx
+
+from backend.services.provider_guard import CircuitBreaker, QuotaBudget
+from backend.utils.settings import settings
+
+RAPIDAPI_HOST = "jsearch.p.rapidapi.com"
+
+# HTTP/2 needs the optional "h2" package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    try:
+        return float(resp.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
+
+class JSearchClient:
+    """Long-lived pooled ``httpx.AsyncClient`` for the JSearch API.
+
+    Connections (and TLS sessions) are reused across requests, HTTP/2 is used
+    when available, and a semaphore bounds how many page requests are in
+    flight at once, so fetching several pages costs about one round-trip.
+    The client and semaphore are bound to the running event loop and are
+    recreated if the loop changes (e.g. between test clients).
+
+    Every call is checked against a :class:`QuotaBudget` and a
+    :class:`CircuitBreaker`; when either refuses, ``fetch_page`` returns
+    ``None`` at once and callers use their cached or fallback data.
+    """
+
+    def __init__(self, url: str = f"https://{RAPIDAPI_HOST}/search", timeout: float = 8.0,
+                 max_connections: int = 20, max_concurrency: int = 5,
+                 budget: Optional[QuotaBudget] = None, breaker: Optional[CircuitBreaker] = None) -> None:
+        self.url = url
+        self.budget = budget or QuotaBudget()
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "x-rapidapi-key": settings.RAPIDAPI_KEY,
+            "x-rapidapi-host": RAPIDAPI_HOST,
+        }
+
+    def _ensure(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client
+
+    async def fetch_page(self, role: str, location: str, page: int,
+                         date_posted: Optional[str] = None) -> Optional[List[dict]]:
+        """Raw JSearch items for one page; ``None`` when the request failed.
+
+        ``date_posted`` ("today", "3days", "week", "month") restricts results
+        to recent postings.
+        """
+        client = self._ensure()
+        params = {
+            "query": f"{role} in {location}" if location else role,
+            "page": page,
+            "num_pages": 1,
+        }
+        if date_posted:
+            params["date_posted"] = date_posted
+        if not self.breaker.allow():
+            # provider known to be failing: fall back without waiting on it
+            return None
+        if not self.budget.try_acquire():
+            self.breaker.release()
+            return None
+        try:
+            async with self._semaphore:
+                resp = await client.get(self.url, params=params, headers=self._headers())
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception:
+            # network error or timeout
+            self.breaker.record_failure()
+            return None
+        if resp.status_code == 429:
+            self.breaker.trip(_retry_after(resp))
+            return None
+        if resp.status_code != 200:
+            self.breaker.record_failure()
+            return None
+        try:
+            data = resp.json().get("data", [])
+        except Exception:
+            self.breaker.record_failure()
+            return None
+        self.breaker.record_success()
+        return data
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError:
+                # created on an event loop that is already closed
+                pass
+        self._client = None
+
+
+jsearch_client = JSearchClient(
+    url=settings.RAPIDAPI_URL,
+    timeout=settings.JSEARCH_TIMEOUT_SECONDS,
+    max_connections=settings.JSEARCH_MAX_CONNECTIONS,
+    max_concurrency=settings.JSEARCH_MAX_CONCURRENCY,
+    budget=QuotaBudget(per_minute=settings.JSEARCH_QUOTA_PER_MINUTE, per_day=settings.JSEARCH_QUOTA_PER_DAY),
+    breaker=CircuitBreaker(
+        failure_threshold=settings.JSEARCH_BREAKER_FAILURES,
+        reset_timeout=settings.JSEARCH_BREAKER_RESET_SECONDS,
+    ),
+)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import copy
+import threading
+import time
+
+from backend.services.query_normalizer import normalize_query
+from backend.utils.settings import settings
+
+
+def canonical_query(role: str, location: str) -> Tuple[str, str]:
+    """Normalized, lowercased form of a market query, used in cache keys.
+
+    Roles map onto catalog roles and locations onto canonical ones (see
+    ``query_normalizer``), so "Front-end dev" in "NYC" shares every cache,
+    corpus and precomputed snapshot with "Frontend Developer" in "New York, NY".
+    """
+    role, location = normalize_query(role, location)
+    return role.lower(), location.lower()
+
+
+class StaleWhileRevalidateCache:
+    """TTL cache that serves stale entries while refreshing them in the background.
+
+    An entry is fresh for ``ttl`` seconds and may then be served for another
+    ``stale_ttl`` seconds, with a single background task reloading it.
+    Older entries and misses are loaded inline. Loaders are coroutine
+    factories; one returning ``None`` (or raising) signals a failed fetch:
+    nothing is cached and the stale value, if any, is kept.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._refreshing: set = set()
+        self._tasks: set = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable) -> Tuple[Optional[object], Optional[float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(key)
+            stored_at, value = entry
+            return value, time.monotonic() - stored_at
+
+    def put(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Optional[object]]]) -> Optional[object]:
+        try:
+            value = await loader()
+        except Exception:
+            value = None
+        if value is not None:
+            self.put(key, value)
+        return value
+
+    async def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Optional[object]]]) -> None:
+        try:
+            await self._load(key, loader)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Awaitable[Optional[object]]]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(self._refresh(key, loader))
+        # keep a reference until done so the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Optional[object]]],
+                          refresh: bool = False) -> Optional[object]:
+        """Cached value for ``key``; ``refresh`` reloads inline even when fresh."""
+        value, age = self._lookup(key)
+        if refresh:
+            loaded = await self._load(key, loader)
+            return copy.deepcopy(value if loaded is None else loaded)
+        if value is not None and age < self.ttl:
+            with self._lock:
+                self.hits += 1
+            return copy.deepcopy(value)
+        if value is not None and age < self.ttl + self.stale_ttl:
+            with self._lock:
+                self.stale_hits += 1
+            self._schedule_refresh(key, loader)
+            return copy.deepcopy(value)
+        with self._lock:
+            self.misses += 1
+        loaded = await self._load(key, loader)
+        if loaded is None:
+            # upstream failed: an expired entry still beats nothing
+            return copy.deepcopy(value)
+        return copy.deepcopy(loaded)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshing": len(self._refreshing),
+                "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+class VersionedCache:
+    """LRU cache of values tagged with the version of the data they were built from.
+
+    ``get`` only returns a value built from the current version and younger
+    than ``ttl`` seconds (time-dependent parts, such as recency windows and
+    decayed scores, still drift without new data); anything else is a miss.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Hashable, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != version or time.monotonic() - entry[0] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[2]
+        return copy.deepcopy(value)
+
+    def put(self, key: Hashable, version: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), version, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one outstanding call.
+
+    The first caller starts ``fn()`` as a task; callers arriving while it runs
+    await the same task and get the same result (or exception). The task is
+    shielded, so a caller that disconnects does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[object]]) -> object:
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.get_running_loop().create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # mark the exception retrieved even if every caller went away
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"inflight": len(self._calls), "calls": self.calls, "shared": self.shared}
+
+
+jsearch_cache = StaleWhileRevalidateCache(
+    ttl=settings.MARKET_CACHE_TTL_SECONDS,
+    stale_ttl=settings.MARKET_CACHE_STALE_SECONDS,
+    maxsize=settings.MARKET_CACHE_MAX_ENTRIES,
+)
+
+# corpus-built snapshots per canonical query, valid until the corpus changes
+corpus_snapshot_cache = VersionedCache(
+    ttl=settings.MARKET_CACHE_TTL_SECONDS,
+    maxsize=settings.MARKET_CACHE_MAX_ENTRIES,
+)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import deque
+from datetime import datetime
+import asyncio
+import copy
+
+from fastapi.concurrency import run_in_threadpool
+
+from backend.services.career_catalog import get_catalog
+from backend.services.market_cache import canonical_query
+from backend.services.query_normalizer import normalize_query
+from backend.services.job_corpus import job_corpus
+from backend.services.market_trend_service import (
+    build_market_snapshot, fetch_job_items, market_snapshot_from_corpus, market_snapshot_from_items,
+)
+from backend.utils.db import get_db
+from backend.utils.settings import settings
+
+Target = Tuple[str, str]
+
+
+class MarketPrecomputeScheduler:
+    """Background refresh of market snapshots for every catalog role.
+
+    Each (role, location) target is rebuilt once per ``interval`` seconds, one
+    target every ``stagger`` seconds so JSearch sees a steady trickle instead
+    of bursts. Snapshots are kept in memory and upserted into the
+    ``market_snapshots`` collection, which warms the store on restart.
+    A failed fetch keeps the previous snapshot.
+    """
+
+    def __init__(self, roles: Iterable[str], locations: Iterable[str], interval: float,
+                 stagger: float, collection: str = "market_snapshots") -> None:
+        targets: List[Target] = []
+        for role in roles:
+            for location in ["", *locations]:
+                target = canonical_query(role, location)
+                if target[0] and target not in targets:
+                    targets.append(target)
+        self.targets = targets
+        self._target_set = set(targets)
+        self.interval = interval
+        self.stagger = stagger
+        self.collection = collection
+        self._snapshots: Dict[Target, dict] = {}
+        self._urgent: "deque[Target]" = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def covers(self, role: str, location: str) -> bool:
+        return canonical_query(role, location) in self._target_set
+
+    def get(self, role: str, location: str) -> Optional[dict]:
+        snapshot = self._snapshots.get(canonical_query(role, location))
+        return copy.deepcopy(snapshot) if snapshot is not None else None
+
+    def prioritize(self, role: str, location: str) -> None:
+        """Queue a covered target ahead of the rest of the refresh cycle."""
+        target = canonical_query(role, location)
+        if target in self._target_set and target not in self._urgent:
+            self._urgent.append(target)
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    async def snapshot(self, role: str, location: str) -> dict:
+        """Market snapshot for a user request.
+
+        The query is normalized first (see ``query_normalizer``). Catalog
+        targets are answered from the precomputed store, or with the
+        role-based fallback while their first refresh is pending; only
+        uncovered queries are built on demand.
+        """
+        role, location = normalize_query(role, location)
+        snapshot = await self._snapshot(role, location)
+        # report the canonical query so clients converge on it
+        snapshot.update(canonical_role=role, canonical_location=location)
+        return snapshot
+
+    async def _snapshot(self, role: str, location: str) -> dict:
+        if self._task is not None and self.covers(role, location):
+            snapshot = self.get(role, location)
+            if snapshot is not None:
+                return snapshot
+            self.prioritize(role, location)
+            return await run_in_threadpool(market_snapshot_from_items, role, None)
+        return await build_market_snapshot(role, location)
+
+    async def refresh(self, target: Target) -> bool:
+        role, location = target
+        # once the corpus holds this query, only recent postings are fetched
+        known = await run_in_threadpool(job_corpus.has_postings, role, location)
+        date_posted = settings.MARKET_CORPUS_DELTA_DATE_POSTED if known else None
+        items = await fetch_job_items(role, location, settings.MARKET_SNAPSHOT_PAGES,
+                                      refresh=True, date_posted=date_posted)
+        if items is None:
+            return False
+        snapshot = await run_in_threadpool(market_snapshot_from_corpus, role, location, items)
+        self._snapshots[target] = snapshot
+        await run_in_threadpool(self._persist, target, snapshot)
+        return True
+
+    def _persist(self, target: Target, snapshot: dict) -> None:
+        if not settings.MONGODB_URI:
+            return
+        try:
+            get_db()[self.collection].update_one(
+                {"role": target[0], "location": target[1]},
+                {"$set": {"snapshot": snapshot, "computed_at": datetime.utcnow()}},
+                upsert=True,
+            )
+        except Exception:
+            pass
+
+    def _warm(self) -> None:
+        if not settings.MONGODB_URI:
+            return
+        try:
+            for doc in get_db()[self.collection].find({}, {"role": 1, "location": 1, "snapshot": 1}):
+                target = (doc.get("role", ""), doc.get("location", ""))
+                if target in self._target_set and doc.get("snapshot"):
+                    self._snapshots[target] = doc["snapshot"]
+        except Exception:
+            pass
+
+    async def _refresh_logged(self, target: Target) -> None:
+        try:
+            ok = await self.refresh(target)
+        except Exception as e:
+            ok = False
+            print(f"⚠️ Market precompute failed for {target}: {e}")
+        if not ok:
+            print(f"⚠️ Market precompute kept previous snapshot for {target}")
+        # stagger every JSearch-bound refresh to respect the rate limit
+        await asyncio.sleep(self.stagger)
+
+    async def _run(self) -> None:
+        await run_in_threadpool(self._warm)
+        loop = asyncio.get_running_loop()
+        while True:
+            cycle_start = loop.time()
+            pending = deque(self.targets)
+            while pending:
+                target = self._urgent.popleft() if self._urgent else pending.popleft()
+                if target in pending:
+                    pending.remove(target)
+                await self._refresh_logged(target)
+            # idle until the next cycle, still serving prioritized targets
+            while (remaining := self.interval - (loop.time() - cycle_start)) > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+                while self._urgent:
+                    await self._refresh_logged(self._urgent.popleft())
+
+    def start(self) -> None:
+        if self._task is not None or not settings.MARKET_PRECOMPUTE_ENABLED or not settings.RAPIDAPI_KEY:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "running": self._task is not None,
+            "targets": len(self.targets),
+            "precomputed": len(self._snapshots),
+            "queued": len(self._urgent),
+        }
+
+
+market_scheduler = MarketPrecomputeScheduler(
+    roles=get_catalog().role_names,
+    locations=settings.market_precompute_locations_list,
+    interval=settings.MARKET_PRECOMPUTE_INTERVAL_SECONDS,
+    stagger=settings.MARKET_PRECOMPUTE_STAGGER_SECONDS,
+)
@@ -1,390 +1,336 @@
 from __future__ import annotations
-from typing import Dict, List
-import requests
-import json
-from pathlib import Path
-from rapidfuzz import fuzz
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+import asyncio
+import copy
 
+from fastapi.concurrency import run_in_threadpool
+
+from backend.services.career_catalog import get_catalog
+from backend.services.demand_rollups import demand_rollups
+from backend.services.job_corpus import job_corpus
+from backend.services.jsearch_client import jsearch_client
+from backend.services.market_cache import SingleFlight, canonical_query, corpus_snapshot_cache, jsearch_cache
+from backend.services.resume_parser import lemmatize_many, normalize
+from backend.services.skill_matcher import TrigramIndex, build_skill_matcher
+from backend.services.trend_matrix import TrendMatrix
 from backend.utils.settings import settings
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data"
-SKILLS_DB_PATH = DATA_DIR / "skills_database.json"
+SKILLS_DB: Sequence[str] = get_catalog().skills
+SKILLS_VERSION = get_catalog().skills_version
+
+_SKILL_KEYS = sorted({s.lower() for s in SKILLS_DB})
+# every catalog skill matched exactly in one pass per posting
+_JD_MATCHER = build_skill_matcher(_SKILL_KEYS)
+# fuzzy tolerance only for single-word skills, proposed per posting token
+_JD_TOKEN_INDEX = TrigramIndex(k for k in _SKILL_KEYS if " " not in k)
+JD_FUZZY_THRESHOLD = 75
+
+# one in-flight snapshot build per canonical (role, location)
+snapshot_flight = SingleFlight()
+
 
-with open(SKILLS_DB_PATH, "r", encoding="utf-8") as f:
-    SKILLS_DB: List[str] = json.load(f)
+def posting_skills(text: str) -> Set[str]:
+    """Catalog skills found in one normalized posting text."""
+    present = _JD_MATCHER.find_all(text)
+    present.update(_JD_TOKEN_INDEX.match(text, threshold=JD_FUZZY_THRESHOLD, exclude=present))
+    return present
 
-RAPIDAPI_HOST = "jsearch.p.rapidapi.com"
-RAPIDAPI_URL = f"https://{RAPIDAPI_HOST}/search"
 
+def _posting_from_item(item: dict) -> dict:
+    # Combine ALL job details for comprehensive skill analysis
+    job_title = item.get("job_title", "")
+    job_desc = item.get("job_description") or item.get("description") or ""
+    company = item.get("employer_name", "")
+    city = item.get("job_city") or ""
+    state = item.get("job_state") or ""
+    highlights = item.get("job_highlights", {})
+    qualifications = " ".join(highlights.get("Qualifications", [])) if isinstance(highlights, dict) else ""
+    responsibilities = " ".join(highlights.get("Responsibilities", [])) if isinstance(highlights, dict) else ""
 
-def _headers() -> Dict[str, str]:
+    # Combine all text for skill extraction
+    full_text = f"{job_title} {job_desc} {company} {city} {state} {qualifications} {responsibilities}"
     return {
-        "x-rapidapi-key": settings.RAPIDAPI_KEY,
-        "x-rapidapi-host": RAPIDAPI_HOST,
+        "text": full_text,
+        "location": f"{city}, {state}" if city and state else (city or state),
     }
 
 
-def fetch_job_descriptions(role: str, location: str, pages: int = 1) -> List[str]:
-    """Fetch job data including title, description, company, location, and requirements."""
-    if not settings.RAPIDAPI_KEY:
-        return []
-    descriptions: List[str] = []
-    for page in range(1, pages + 1):
-        params = {
-            "query": f"{role} in {location}" if location else role,
-            "page": page,
-            "num_pages": 1,
-        }
+async def _load_job_page(role: str, location: str, page: int,
+                         date_posted: Optional[str]) -> Optional[List[dict]]:
+    items = await jsearch_client.fetch_page(role, location, page, date_posted)
+    if items:
+        # only pages actually fetched upstream can hold postings the corpus lacks
         try:
-            resp = requests.get(RAPIDAPI_URL, headers=_headers(), params=params, timeout=8)
-            if resp.status_code == 200:
-                data = resp.json()
-                for item in data.get("data", []):
-                    # Combine ALL job details for comprehensive skill analysis
-                    job_title = item.get("job_title", "")
-                    job_desc = item.get("job_description") or item.get("description") or ""
-                    company = item.get("employer_name", "")
-                    job_location = item.get("job_city", "") + " " + item.get("job_state", "")
-                    highlights = item.get("job_highlights", {})
-                    qualifications = " ".join(highlights.get("Qualifications", [])) if isinstance(highlights, dict) else ""
-                    responsibilities = " ".join(highlights.get("Responsibilities", [])) if isinstance(highlights, dict) else ""
-                    
-                    # Combine all text for skill extraction
-                    full_text = f"{job_title} {job_desc} {company} {job_location} {qualifications} {responsibilities}"
-                    if full_text.strip():
-                        descriptions.append(full_text)
-            else:
-                # fallback silently on non-200
-                pass
-        except Exception:
-            # network error: ignore
-            pass
-    return descriptions
-
-
-def compute_trending_skills(role: str, location: str) -> List[dict]:
-    jds = fetch_job_descriptions(role, location, pages=1)
-
-    if not jds:
-        # If no job descriptions, generate based on role type
-        print(f"⚠️ No job descriptions found for {role}. Using role-based fallback...")
-        role_lower = role.lower()
-        
-        # Role-specific skill recommendations (ALL SECTORS)
-        role_skills = {
-            # Software & IT
-            "frontend": ["react", "typescript", "javascript", "tailwindcss", "html", "css", "next.js", "vue.js"],
-            "backend": ["python", "fastapi", "node.js", "database", "sql", "rest api", "docker", "kubernetes"],
-            "data scientist": ["python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis", "sql"],
-            "ml engineer": ["python", "tensorflow", "pytorch", "machine learning", "data structures", "algorithms"],
-            "devops": ["docker", "kubernetes", "aws", "ci/cd", "jenkins", "terraform", "linux"],
-            "full stack": ["react", "node.js", "python", "database", "docker", "git", "javascript", "typescript"],
-            "mobile app": ["react native", "flutter", "kotlin", "swift", "mobile ui", "api integration"],
-            "cybersecurity": ["network security", "penetration testing", "ethical hacking", "firewall", "encryption"],
-            
-            # Healthcare
-            "medical doctor": ["clinical diagnosis", "patient care", "medical ethics", "pharmacology", "anatomy", "surgery", "pathology", "radiology"],
-            "registered nurse": ["patient care", "medication administration", "vital signs monitoring", "emergency care", "clinical procedures", "health assessment"],
-            "pharmacist": ["pharmacology", "drug interactions", "pharmaceutical care", "medication counseling", "prescription verification", "clinical pharmacy"],
-            "clinical psychologist": ["psychological assessment", "cognitive behavioral therapy", "counseling", "mental health diagnosis", "psychotherapy", "dsm-5"],
-            "medical lab technician": ["laboratory procedures", "specimen analysis", "hematology", "microbiology", "quality control", "lab safety"],
-            
-            # Engineering
-            "chemical engineer": ["chemical processes", "process design", "thermodynamics", "material science", "reaction kinetics", "plant design"],
-            "civil engineer": ["structural design", "autocad", "construction management", "soil mechanics", "surveying", "project planning"],
-            "mechanical engineer": ["solidworks", "cad design", "thermodynamics", "fluid mechanics", "manufacturing processes", "machine design"],
-            "electrical engineer": ["circuit design", "plc programming", "power systems", "control systems", "embedded systems", "matlab"],
-            "environmental engineer": ["environmental impact assessment", "water treatment", "air quality", "waste management", "sustainability", "gis"],
-            
-            # Education
-            "high school teacher": ["lesson planning", "classroom management", "curriculum development", "student assessment", "educational technology", "pedagogy"],
-            "university professor": ["research methodology", "academic writing", "curriculum design", "higher education", "grant writing", "student mentoring"],
-            "education administrator": ["educational leadership", "policy development", "budget management", "staff development", "strategic planning"],
-            "curriculum developer": ["instructional design", "learning outcomes", "curriculum mapping", "educational standards", "assessment design"],
-            
-            # Agriculture
-            "agricultural scientist": ["crop science", "plant breeding", "soil science", "agricultural research", "pest management", "biotechnology"],
-            "farm manager": ["crop management", "farm operations", "agricultural economics", "equipment operation", "irrigation management", "harvest planning"],
-            "agricultural engineer": ["precision agriculture", "irrigation systems", "farm machinery", "agricultural technology", "drainage systems"],
-            "soil scientist": ["soil analysis", "soil chemistry", "land management", "soil fertility", "soil conservation", "environmental soil science"],
-            
-            # Business
-            "project manager": ["project planning", "agile", "scrum", "stakeholder management", "risk management", "jira", "ms project"],
-            "product manager": ["product strategy", "user research", "roadmap planning", "market analysis", "agile", "product analytics"],
-            "business analyst": ["requirements analysis", "data analysis", "sql", "process improvement", "stakeholder communication", "documentation"],
-            "marketing manager": ["digital marketing", "seo", "content strategy", "social media", "marketing analytics", "brand management"],
-        }
-        
-        # Find matching skills for the role
-        recommended = []
-        for role_key, skills in role_skills.items():
-            if role_key in role_lower:
-                recommended = skills
-                break
-        
-        # If no match, try partial matching
-        if not recommended:
-            for role_key, skills in role_skills.items():
-                if any(word in role_lower for word in role_key.split()):
-                    recommended = skills
-                    break
-        
-        # If still no match, use general professional skills
-        if not recommended:
-            recommended = ["communication", "teamwork", "problem solving", "leadership", "time management", "critical thinking"]
-        
-        return [
-            {"name": s.title(), "importance": round(1.0 - i * 0.08, 2), "job_count": max(1, 50 - i * 3)}
-            for i, s in enumerate(recommended)
-        ]
-
-    # frequency-based importance
-    freq: Dict[str, int] = {s.lower(): 0 for s in SKILLS_DB}
-    for jd in jds:
-        text = jd.lower()
-        for s in SKILLS_DB:
-            key = s.lower()
-            if " " in key:
-                if key in text:
-                    freq[key] += 1
-            else:
-                # fuzzy token match - LOWERED from 90 to 75
-                if fuzz.partial_ratio(key, text) >= 75:
-                    freq[key] += 1
-
-    items = [
-        {"name": k.title(), "job_count": v}
-        for k, v in freq.items() if v > 0
-    ]
-    if not items:
-        # Fallback to role-based if frequency-based fails
-        print(f"⚠️ No skills matched from job descriptions. Using role-based fallback...")
-        role_lower = role.lower()
-        
-        # Role-specific skill recommendations (ALL SECTORS)
-        role_skills = {
-            # Software & IT
-            "frontend": ["react", "typescript", "javascript", "tailwindcss", "html", "css", "next.js", "vue.js"],
-            "backend": ["python", "fastapi", "node.js", "database", "sql", "rest api", "docker", "kubernetes"],
-            "data scientist": ["python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis", "sql"],
-            "ml engineer": ["python", "tensorflow", "pytorch", "machine learning", "data structures", "algorithms"],
-            "devops": ["docker", "kubernetes", "aws", "ci/cd", "jenkins", "terraform", "linux"],
-            "full stack": ["react", "node.js", "python", "database", "docker", "git", "javascript", "typescript"],
-            "mobile app": ["react native", "flutter", "kotlin", "swift", "mobile ui", "api integration"],
-            "cybersecurity": ["network security", "penetration testing", "ethical hacking", "firewall", "encryption"],
-            
-            # Healthcare
-            "medical doctor": ["clinical diagnosis", "patient care", "medical ethics", "pharmacology", "anatomy", "surgery", "pathology", "radiology"],
-            "registered nurse": ["patient care", "medication administration", "vital signs monitoring", "emergency care", "clinical procedures", "health assessment"],
-            "pharmacist": ["pharmacology", "drug interactions", "pharmaceutical care", "medication counseling", "prescription verification", "clinical pharmacy"],
-            "clinical psychologist": ["psychological assessment", "cognitive behavioral therapy", "counseling", "mental health diagnosis", "psychotherapy", "dsm-5"],
-            "medical lab technician": ["laboratory procedures", "specimen analysis", "hematology", "microbiology", "quality control", "lab safety"],
-            
-            # Engineering
-            "chemical engineer": ["chemical processes", "process design", "thermodynamics", "material science", "reaction kinetics", "plant design"],
-            "civil engineer": ["structural design", "autocad", "construction management", "soil mechanics", "surveying", "project planning"],
-            "mechanical engineer": ["solidworks", "cad design", "thermodynamics", "fluid mechanics", "manufacturing processes", "machine design"],
-            "electrical engineer": ["circuit design", "plc programming", "power systems", "control systems", "embedded systems", "matlab"],
-            "environmental engineer": ["environmental impact assessment", "water treatment", "air quality", "waste management", "sustainability", "gis"],
-            
-            # Education
-            "high school teacher": ["lesson planning", "classroom management", "curriculum development", "student assessment", "educational technology", "pedagogy"],
-            "university professor": ["research methodology", "academic writing", "curriculum design", "higher education", "grant writing", "student mentoring"],
-            "education administrator": ["educational leadership", "policy development", "budget management", "staff development", "strategic planning"],
-            "curriculum developer": ["instructional design", "learning outcomes", "curriculum mapping", "educational standards", "assessment design"],
-            
-            # Agriculture
-            "agricultural scientist": ["crop science", "plant breeding", "soil science", "agricultural research", "pest management", "biotechnology"],
-            "farm manager": ["crop management", "farm operations", "agricultural economics", "equipment operation", "irrigation management", "harvest planning"],
-            "agricultural engineer": ["precision agriculture", "irrigation systems", "farm machinery", "agricultural technology", "drainage systems"],
-            "soil scientist": ["soil analysis", "soil chemistry", "land management", "soil fertility", "soil conservation", "environmental soil science"],
-            
-            # Business
-            "project manager": ["project planning", "agile", "scrum", "stakeholder management", "risk management", "jira", "ms project"],
-            "product manager": ["product strategy", "user research", "roadmap planning", "market analysis", "agile", "product analytics"],
-            "business analyst": ["requirements analysis", "data analysis", "sql", "process improvement", "stakeholder communication", "documentation"],
-            "marketing manager": ["digital marketing", "seo", "content strategy", "social media", "marketing analytics", "brand management"],
-        }
-        
-        recommended = []
-        for role_key, skills in role_skills.items():
-            if role_key in role_lower:
-                recommended = skills
-                break
-        
-        # If no match, try partial matching
-        if not recommended:
-            for role_key, skills in role_skills.items():
-                if any(word in role_lower for word in role_key.split()):
-                    recommended = skills
-                    break
-        
-        # If still no match, use general professional skills
-        if not recommended:
-            recommended = ["communication", "teamwork", "problem solving", "leadership", "time management", "critical thinking"]
-        
-        return [
-            {"name": s.title(), "importance": round(1.0 - i * 0.08, 2), "job_count": max(1, 50 - i * 3)}
-            for i, s in enumerate(recommended)
-        ]
+            await run_in_threadpool(ingest_items, role, location, items)
+        except Exception as e:
+            print(f"⚠️ Job corpus ingest failed for {role} in {location}: {e}")
+    return items
+
 
-    max_count = max(i["job_count"] for i in items)
-    for i in items:
-        i["importance"] = round(i["job_count"] / max(1, max_count), 3)
+async def fetch_job_page(role: str, location: str, page: int, refresh: bool = False,
+                         date_posted: Optional[str] = None) -> Optional[List[dict]]:
+    """One page of raw JSearch items, cached by the canonical (role, location, page).
 
-    # sort by importance desc, limit 25
-    items.sort(key=lambda x: (-x["importance"], -x["job_count"]))
-    return items[:25]
+    Pages loaded from JSearch (not page-cache hits) are ingested into the
+    job corpus as they arrive.
+    """
+    key = (*canonical_query(role, location), page, date_posted)
+    return await jsearch_cache.get_or_load(
+        key, lambda: _load_job_page(role, location, page, date_posted), refresh=refresh
+    )
 
 
-def compute_market_statistics(role: str, location: str) -> dict:
-    """Compute market statistics from job data."""
-    # Role-specific realistic statistics (ALL SECTORS)
-    role_stats = {
+async def fetch_job_items(role: str, location: str, pages: int = 1, refresh: bool = False,
+                          date_posted: Optional[str] = None) -> Optional[List[dict]]:
+    """Raw JSearch items of the first ``pages`` pages, fetched concurrently.
+
+    Returns ``None`` when the API key is missing or every page failed, so
+    callers can tell "no data" from "no postings".
+    """
+    if not settings.RAPIDAPI_KEY:
+        return None
+    results = await asyncio.gather(
+        *(fetch_job_page(role, location, page, refresh, date_posted) for page in range(1, pages + 1))
+    )
+    if all(r is None for r in results):
+        return None
+    return [item for r in results if r for item in r]
+
+
+def postings_from_items(items: Iterable[dict]) -> List[dict]:
+    postings = [_posting_from_item(item) for item in items]
+    return [p for p in postings if p["text"].strip()]
+
+
+def _fallback_trending_skills(role: str) -> List[dict]:
+    role_lower = role.lower()
+
+    # Role-specific skill recommendations (ALL SECTORS)
+    role_skills = {
         # Software & IT
-        "frontend developer": {"job_openings": 12500, "avg_salary": 115000, "growth_rate": 15, "remote_percentage": 72},
-        "backend developer": {"job_openings": 14200, "avg_salary": 125000, "growth_rate": 18, "remote_percentage": 68},
-        "full stack developer": {"job_openings": 10800, "avg_salary": 120000, "growth_rate": 16, "remote_percentage": 70},
-        "data scientist": {"job_openings": 8900, "avg_salary": 135000, "growth_rate": 36, "remote_percentage": 62},
-        "ml engineer": {"job_openings": 5600, "avg_salary": 155000, "growth_rate": 45, "remote_percentage": 60},
-        "machine learning engineer": {"job_openings": 5600, "avg_salary": 155000, "growth_rate": 45, "remote_percentage": 60},
-        "devops engineer": {"job_openings": 7200, "avg_salary": 130000, "growth_rate": 28, "remote_percentage": 65},
-        "mobile app developer": {"job_openings": 9500, "avg_salary": 118000, "growth_rate": 22, "remote_percentage": 55},
-        "cybersecurity specialist": {"job_openings": 6800, "avg_salary": 140000, "growth_rate": 35, "remote_percentage": 45},
+        "frontend": ["react", "typescript", "javascript", "tailwindcss", "html", "css", "next.js", "vue.js"],
+        "backend": ["python", "fastapi", "node.js", "database", "sql", "rest api", "docker", "kubernetes"],
+        "data scientist": ["python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis", "sql"],
+        "ml engineer": ["python", "tensorflow", "pytorch", "machine learning", "data structures", "algorithms"],
+        "devops": ["docker", "kubernetes", "aws", "ci/cd", "jenkins", "terraform", "linux"],
+        "full stack": ["react", "node.js", "python", "database", "docker", "git", "javascript", "typescript"],
+        "mobile app": ["react native", "flutter", "kotlin", "swift", "mobile ui", "api integration"],
+        "cybersecurity": ["network security", "penetration testing", "ethical hacking", "firewall", "encryption"],
         
         # Healthcare
-        "medical doctor": {"job_openings": 18500, "avg_salary": 235000, "growth_rate": 8, "remote_percentage": 15},
-        "registered nurse": {"job_openings": 42000, "avg_salary": 82000, "growth_rate": 12, "remote_percentage": 8},
-        "pharmacist": {"job_openings": 7200, "avg_salary": 128000, "growth_rate": 5, "remote_percentage": 5},
-        "clinical psychologist": {"job_openings": 6500, "avg_salary": 105000, "growth_rate": 18, "remote_percentage": 35},
-        "medical lab technician": {"job_openings": 15000, "avg_salary": 58000, "growth_rate": 10, "remote_percentage": 2},
+        "medical doctor": ["clinical diagnosis", "patient care", "medical ethics", "pharmacology", "anatomy", "surgery", "pathology", "radiology"],
+        "registered nurse": ["patient care", "medication administration", "vital signs monitoring", "emergency care", "clinical procedures", "health assessment"],
+        "pharmacist": ["pharmacology", "drug interactions", "pharmaceutical care", "medication counseling", "prescription verification", "clinical pharmacy"],
+        "clinical psychologist": ["psychological assessment", "cognitive behavioral therapy", "counseling", "mental health diagnosis", "psychotherapy", "dsm-5"],
+        "medical lab technician": ["laboratory procedures", "specimen analysis", "hematology", "microbiology", "quality control", "lab safety"],
         
         # Engineering
-        "chemical engineer": {"job_openings": 5400, "avg_salary": 112000, "growth_rate": 7, "remote_percentage": 25},
-        "civil engineer": {"job_openings": 12800, "avg_salary": 95000, "growth_rate": 8, "remote_percentage": 20},
-        "mechanical engineer": {"job_openings": 14200, "avg_salary": 98000, "growth_rate": 6, "remote_percentage": 22},
-        "electrical engineer": {"job_openings": 11500, "avg_salary": 105000, "growth_rate": 9, "remote_percentage": 28},
-        "environmental engineer": {"job_openings": 4800, "avg_salary": 92000, "growth_rate": 11, "remote_percentage": 18},
+        "chemical engineer": ["chemical processes", "process design", "thermodynamics", "material science", "reaction kinetics", "plant design"],
+        "civil engineer": ["structural design", "autocad", "construction management", "soil mechanics", "surveying", "project planning"],
+        "mechanical engineer": ["solidworks", "cad design", "thermodynamics", "fluid mechanics", "manufacturing processes", "machine design"],
+        "electrical engineer": ["circuit design", "plc programming", "power systems", "control systems", "embedded systems", "matlab"],
+        "environmental engineer": ["environmental impact assessment", "water treatment", "air quality", "waste management", "sustainability", "gis"],
         
         # Education
-        "high school teacher": {"job_openings": 28000, "avg_salary": 68000, "growth_rate": 5, "remote_percentage": 12},
-        "university professor": {"job_openings": 8500, "avg_salary": 115000, "growth_rate": 7, "remote_percentage": 25},
-        "education administrator": {"job_openings": 9200, "avg_salary": 98000, "growth_rate": 8, "remote_percentage": 15},
-        "curriculum developer": {"job_openings": 4200, "avg_salary": 72000, "growth_rate": 10, "remote_percentage": 45},
+        "high school teacher": ["lesson planning", "classroom management", "curriculum development", "student assessment", "educational technology", "pedagogy"],
+        "university professor": ["research methodology", "academic writing", "curriculum design", "higher education", "grant writing", "student mentoring"],
+        "education administrator": ["educational leadership", "policy development", "budget management", "staff development", "strategic planning"],
+        "curriculum developer": ["instructional design", "learning outcomes", "curriculum mapping", "educational standards", "assessment design"],
         
         # Agriculture
-        "agricultural scientist": {"job_openings": 3800, "avg_salary": 88000, "growth_rate": 6, "remote_percentage": 10},
-        "farm manager": {"job_openings": 6500, "avg_salary": 75000, "growth_rate": 4, "remote_percentage": 5},
-        "agricultural engineer": {"job_openings": 2400, "avg_salary": 92000, "growth_rate": 8, "remote_percentage": 15},
-        "soil scientist": {"job_openings": 1800, "avg_salary": 78000, "growth_rate": 7, "remote_percentage": 12},
+        "agricultural scientist": ["crop science", "plant breeding", "soil science", "agricultural research", "pest management", "biotechnology"],
+        "farm manager": ["crop management", "farm operations", "agricultural economics", "equipment operation", "irrigation management", "harvest planning"],
+        "agricultural engineer": ["precision agriculture", "irrigation systems", "farm machinery", "agricultural technology", "drainage systems"],
+        "soil scientist": ["soil analysis", "soil chemistry", "land management", "soil fertility", "soil conservation", "environmental soil science"],
         
-        # Business & Management
-        "project manager": {"job_openings": 16500, "avg_salary": 118000, "growth_rate": 14, "remote_percentage": 58},
-        "product manager": {"job_openings": 11200, "avg_salary": 135000, "growth_rate": 20, "remote_percentage": 65},
-        "business analyst": {"job_openings": 14800, "avg_salary": 95000, "growth_rate": 12, "remote_percentage": 52},
-        "marketing manager": {"job_openings": 13400, "avg_salary": 102000, "growth_rate": 10, "remote_percentage": 48},
+        # Business
+        "project manager": ["project planning", "agile", "scrum", "stakeholder management", "risk management", "jira", "ms project"],
+        "product manager": ["product strategy", "user research", "roadmap planning", "market analysis", "agile", "product analytics"],
+        "business analyst": ["requirements analysis", "data analysis", "sql", "process improvement", "stakeholder communication", "documentation"],
+        "marketing manager": ["digital marketing", "seo", "content strategy", "social media", "marketing analytics", "brand management"],
+    }
+
+    # Find matching skills for the role
+    recommended = []
+    for role_key, skills in role_skills.items():
+        if role_key in role_lower:
+            recommended = skills
+            break
+
+    # If no match, try partial matching
+    if not recommended:
+        for role_key, skills in role_skills.items():
+            if any(word in role_lower for word in role_key.split()):
+                recommended = skills
+                break
+
+    # If still no match, use general professional skills
+    if not recommended:
+        recommended = ["communication", "teamwork", "problem solving", "leadership", "time management", "critical thinking"]
+
+    return [
+        {"name": s.title(), "importance": round(1.0 - i * 0.08, 2), "job_count": max(1, 50 - i * 3)}
+        for i, s in enumerate(recommended)
+    ]
+
+
+def build_trend_matrix(postings: List[dict]) -> TrendMatrix:
+    """Match skills in every posting and lay them out as a postings x skills matrix."""
+    # lemmatize all postings in one batched spaCy pass (no-op without spaCy)
+    texts = lemmatize_many([normalize(p["text"]) for p in postings])
+    return TrendMatrix.from_skill_sets(
+        (posting_skills(t) for t in texts), _SKILL_KEYS,
+        locations=[p.get("location", "") for p in postings],
+    )
+
+
+def trend_report_from_items(role: str, items: Optional[List[dict]]) -> dict:
+    """Trending skills plus the skills requested alongside them and per-location leaders."""
+    postings = postings_from_items(items or [])
+    if not postings:
+        print(f"⚠️ No job descriptions found for {role}. Using role-based fallback...")
+        return {"trending_skills": _fallback_trending_skills(role), "skill_cooccurrence": {}, "skills_by_location": {}}
+    return trend_report_from_matrix(role, build_trend_matrix(postings))
+
+
+def trend_report_from_matrix(role: str, matrix: TrendMatrix, trending: Optional[List[dict]] = None) -> dict:
+    """Trend report of a matched matrix; ``trending`` (e.g. from a demand rollup) replaces its top skills."""
+    top = trending or matrix.top_skills(limit=25)
+    if not top:
+        print(f"⚠️ No skills matched from job descriptions. Using role-based fallback...")
+        return {"trending_skills": _fallback_trending_skills(role), "skill_cooccurrence": {}, "skills_by_location": {}}
+
+    return {
+        "trending_skills": top,
+        "skill_cooccurrence": matrix.cooccurrence([i["name"].lower() for i in top[:10]]),
+        "skills_by_location": matrix.by_location(),
     }
+
+
+# Role-specific realistic statistics (ALL SECTORS)
+ROLE_MARKET_STATS: Dict[str, dict] = {
+    # Software & IT
+    "frontend developer": {"job_openings": 12500, "avg_salary": 115000, "growth_rate": 15, "remote_percentage": 72},
+    "backend developer": {"job_openings": 14200, "avg_salary": 125000, "growth_rate": 18, "remote_percentage": 68},
+    "full stack developer": {"job_openings": 10800, "avg_salary": 120000, "growth_rate": 16, "remote_percentage": 70},
+    "data scientist": {"job_openings": 8900, "avg_salary": 135000, "growth_rate": 36, "remote_percentage": 62},
+    "ml engineer": {"job_openings": 5600, "avg_salary": 155000, "growth_rate": 45, "remote_percentage": 60},
+    "machine learning engineer": {"job_openings": 5600, "avg_salary": 155000, "growth_rate": 45, "remote_percentage": 60},
+    "devops engineer": {"job_openings": 7200, "avg_salary": 130000, "growth_rate": 28, "remote_percentage": 65},
+    "mobile app developer": {"job_openings": 9500, "avg_salary": 118000, "growth_rate": 22, "remote_percentage": 55},
+    "mobile developer": {"job_openings": 9500, "avg_salary": 118000, "growth_rate": 22, "remote_percentage": 55},
+    "cybersecurity specialist": {"job_openings": 6800, "avg_salary": 140000, "growth_rate": 35, "remote_percentage": 45},
     
-    if not settings.RAPIDAPI_KEY:
-        # Return role-specific fallback data when API key is missing
-        role_lower = role.lower()
-        stats = role_stats.get(role_lower)
-        
-        if not stats:
-            # Generic fallback
-            stats = {
-                "job_openings": 12000,
-                "avg_salary": 120000,
-                "growth_rate": 25,
-                "remote_percentage": 65,
-            }
-        
-        return {
-            **stats,
-            "top_companies": ["Google", "Microsoft", "Amazon", "Meta", "Apple", "Netflix", "Stripe"],
-            "top_locations": ["San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX", "Boston, MA"]
-        }
+    # Healthcare
+    "medical doctor": {"job_openings": 18500, "avg_salary": 235000, "growth_rate": 8, "remote_percentage": 15},
+    "registered nurse": {"job_openings": 42000, "avg_salary": 82000, "growth_rate": 12, "remote_percentage": 8},
+    "pharmacist": {"job_openings": 7200, "avg_salary": 128000, "growth_rate": 5, "remote_percentage": 5},
+    "clinical psychologist": {"job_openings": 6500, "avg_salary": 105000, "growth_rate": 18, "remote_percentage": 35},
+    "medical lab technician": {"job_openings": 15000, "avg_salary": 58000, "growth_rate": 10, "remote_percentage": 2},
     
+    # Engineering
+    "chemical engineer": {"job_openings": 5400, "avg_salary": 112000, "growth_rate": 7, "remote_percentage": 25},
+    "civil engineer": {"job_openings": 12800, "avg_salary": 95000, "growth_rate": 8, "remote_percentage": 20},
+    "mechanical engineer": {"job_openings": 14200, "avg_salary": 98000, "growth_rate": 6, "remote_percentage": 22},
+    "electrical engineer": {"job_openings": 11500, "avg_salary": 105000, "growth_rate": 9, "remote_percentage": 28},
+    "environmental engineer": {"job_openings": 4800, "avg_salary": 92000, "growth_rate": 11, "remote_percentage": 18},
+    
+    # Education
+    "high school teacher": {"job_openings": 28000, "avg_salary": 68000, "growth_rate": 5, "remote_percentage": 12},
+    "university professor": {"job_openings": 8500, "avg_salary": 115000, "growth_rate": 7, "remote_percentage": 25},
+    "education administrator": {"job_openings": 9200, "avg_salary": 98000, "growth_rate": 8, "remote_percentage": 15},
+    "curriculum developer": {"job_openings": 4200, "avg_salary": 72000, "growth_rate": 10, "remote_percentage": 45},
+    
+    # Agriculture
+    "agricultural scientist": {"job_openings": 3800, "avg_salary": 88000, "growth_rate": 6, "remote_percentage": 10},
+    "farm manager": {"job_openings": 6500, "avg_salary": 75000, "growth_rate": 4, "remote_percentage": 5},
+    "agricultural engineer": {"job_openings": 2400, "avg_salary": 92000, "growth_rate": 8, "remote_percentage": 15},
+    "soil scientist": {"job_openings": 1800, "avg_salary": 78000, "growth_rate": 7, "remote_percentage": 12},
+    
+    # Business & Management
+    "project manager": {"job_openings": 16500, "avg_salary": 118000, "growth_rate": 14, "remote_percentage": 58},
+    "product manager": {"job_openings": 11200, "avg_salary": 135000, "growth_rate": 20, "remote_percentage": 65},
+    "business analyst": {"job_openings": 14800, "avg_salary": 95000, "growth_rate": 12, "remote_percentage": 52},
+    "marketing manager": {"job_openings": 13400, "avg_salary": 102000, "growth_rate": 10, "remote_percentage": 48},
+}
+
+DEFAULT_TOP_COMPANIES = ["Google", "Microsoft", "Amazon", "Meta", "Apple", "Netflix", "Stripe"]
+DEFAULT_TOP_LOCATIONS = ["San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX", "Boston, MA"]
+
+
+def _fallback_market_statistics(role: str) -> dict:
+    stats = ROLE_MARKET_STATS.get(role.lower(), {
+        "job_openings": 12000,
+        "avg_salary": 120000,
+        "growth_rate": 25,
+        "remote_percentage": 65,
+    })
+    return {
+        **stats,
+        "top_companies": list(DEFAULT_TOP_COMPANIES),
+        "top_locations": list(DEFAULT_TOP_LOCATIONS),
+    }
+
+
+def _statistics_from_jobs(jobs: List[dict], sample_size: Optional[int] = None) -> dict:
+    if not jobs:
+        raise Exception("No jobs found")
+
+    # Calculate statistics
+    total_jobs = len(jobs)
+    
+    # Average salary calculation
+    salaries = []
+    for job in jobs:
+        if job.get("job_min_salary") and job.get("job_max_salary"):
+            avg = (job["job_min_salary"] + job["job_max_salary"]) / 2
+            salaries.append(avg)
+    
+    avg_salary = int(sum(salaries) / len(salaries)) if salaries else 120000
+    
+    # Remote percentage
+    remote_jobs = sum(1 for job in jobs if job.get("job_is_remote", False))
+    remote_percentage = int((remote_jobs / total_jobs) * 100) if total_jobs > 0 else 68
+    
+    # Top companies
+    company_counts = {}
+    for job in jobs:
+        company = job.get("employer_name", "Unknown")
+        if company and company != "Unknown":
+            company_counts[company] = company_counts.get(company, 0) + 1
+    
+    top_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    top_companies = [c[0] for c in top_companies] if top_companies else ["Google", "Microsoft", "Amazon", "Meta", "Apple"]
+    
+    # Top locations
+    location_counts = {}
+    for job in jobs:
+        city = job.get("job_city")
+        state = job.get("job_state")
+        if city and state:
+            loc = f"{city}, {state}"
+            location_counts[loc] = location_counts.get(loc, 0) + 1
+    
+    top_locations = sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    top_locations = [l[0] for l in top_locations] if top_locations else ["San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX", "Boston, MA"]
+    
+    return {
+        "job_openings": (sample_size or total_jobs) * 150,  # Extrapolate from sample
+        "avg_salary": avg_salary,
+        "growth_rate": 28,  # replaced from the demand rollup once it has history
+        "remote_percentage": remote_percentage,
+        "top_companies": top_companies,
+        "top_locations": top_locations
+    }
+
+
+def market_statistics_from_items(role: str, items: Optional[List[dict]], sample_size: Optional[int] = None) -> dict:
+    """Salary/remote/company/location statistics of already fetched JSearch items."""
+    if items is None:
+        # API key missing or API error: role-specific fallback data
+        return _fallback_market_statistics(role)
     try:
-        # Fetch job data from API
-        params = {
-            "query": role,
-            "page": "1",
-            "num_pages": "2"
-        }
-        if location:
-            params["location"] = location
-        
-        resp = requests.get(RAPIDAPI_URL, headers=_headers(), params=params, timeout=10)
-        
-        if resp.status_code != 200:
-            # Fallback to role-specific stats on API error
-            role_lower = role.lower()
-            stats = role_stats.get(role_lower, {
-                "job_openings": 12000,
-                "avg_salary": 120000,
-                "growth_rate": 25,
-                "remote_percentage": 65,
-            })
-            return {
-                **stats,
-                "top_companies": ["Google", "Microsoft", "Amazon", "Meta", "Apple", "Netflix", "Stripe"],
-                "top_locations": ["San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX", "Boston, MA"]
-            }
-        
-        data = resp.json()
-        jobs = data.get("data", [])
-        
-        if not jobs:
-            raise Exception("No jobs found")
-        
-        # Calculate statistics
-        total_jobs = len(jobs)
-        
-        # Average salary calculation
-        salaries = []
-        for job in jobs:
-            if job.get("job_min_salary") and job.get("job_max_salary"):
-                avg = (job["job_min_salary"] + job["job_max_salary"]) / 2
-                salaries.append(avg)
-        
-        avg_salary = int(sum(salaries) / len(salaries)) if salaries else 120000
-        
-        # Remote percentage
-        remote_jobs = sum(1 for job in jobs if job.get("job_is_remote", False))
-        remote_percentage = int((remote_jobs / total_jobs) * 100) if total_jobs > 0 else 68
-        
-        # Top companies
-        company_counts = {}
-        for job in jobs:
-            company = job.get("employer_name", "Unknown")
-            if company and company != "Unknown":
-                company_counts[company] = company_counts.get(company, 0) + 1
-        
-        top_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_companies = [c[0] for c in top_companies] if top_companies else ["Google", "Microsoft", "Amazon", "Meta", "Apple"]
-        
-        # Top locations
-        location_counts = {}
-        for job in jobs:
-            city = job.get("job_city")
-            state = job.get("job_state")
-            if city and state:
-                loc = f"{city}, {state}"
-                location_counts[loc] = location_counts.get(loc, 0) + 1
-        
-        top_locations = sorted(location_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_locations = [l[0] for l in top_locations] if top_locations else ["San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX", "Boston, MA"]
-        
-        return {
-            "job_openings": total_jobs * 150,  # Extrapolate from sample
-            "avg_salary": avg_salary,
-            "growth_rate": 28,  # This would need historical data
-            "remote_percentage": remote_percentage,
-            "top_companies": top_companies,
-            "top_locations": top_locations
-        }
-        
+        return _statistics_from_jobs(items, sample_size)
     except Exception:
         # Return fallback data on any error
         return {
@@ -392,6 +338,100 @@ def compute_market_statistics(role: str, location: str) -> dict:
             "avg_salary": 120000,
             "growth_rate": 28,
             "remote_percentage": 68,
-            "top_companies": ["Google", "Microsoft", "Amazon", "Meta", "Apple"],
-            "top_locations": ["San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX", "Boston, MA"]
+            "top_companies": DEFAULT_TOP_COMPANIES[:5],
+            "top_locations": list(DEFAULT_TOP_LOCATIONS),
         }
+
+
+def market_snapshot_from_items(role: str, items: Optional[List[dict]], sample_size: Optional[int] = None) -> dict:
+    return {
+        **trend_report_from_items(role, items),
+        **market_statistics_from_items(role, items, sample_size),
+    }
+
+
+def match_postings(docs: List[dict]) -> List[Set[str]]:
+    """Catalog skills of raw JSearch items (or stored postings), lemmatized in one batch."""
+    texts = lemmatize_many([normalize(_posting_from_item(doc)["text"]) for doc in docs])
+    return [posting_skills(t) for t in texts]
+
+
+def ingest_items(role: str, location: str, items: List[dict]) -> None:
+    """Store fetched items in the job corpus; match and roll up the postings new to the query.
+
+    This is the only skill pass over a posting: its skills are stored with
+    it and folded into the demand rollup in the same step.
+    """
+    new = job_corpus.ingest(role, location, items)
+    if not new:
+        return
+    skills = match_postings(new)
+    job_corpus.set_skills({doc["job_id"]: s for doc, s in zip(new, skills)}, SKILLS_VERSION)
+    demand_rollups.record(role, location, zip((doc["posted_at"] for doc in new), skills))
+
+
+def corpus_skill_sets(corpus: List[dict]) -> List[Set[str]]:
+    """Stored skills of corpus postings; ones matched with an older skills DB (or never) are matched now."""
+    stale = [doc for doc in corpus if doc.get("skills_version") != SKILLS_VERSION]
+    if stale:
+        for doc, skills in zip(stale, match_postings(stale)):
+            doc["skills"] = sorted(skills)
+        job_corpus.set_skills({doc["job_id"]: doc["skills"] for doc in stale}, SKILLS_VERSION)
+    return [set(doc.get("skills", ())) for doc in corpus]
+
+
+def market_snapshot_from_corpus(role: str, location: str, items: Optional[List[dict]]) -> dict:
+    """Market snapshot of a query built from its recent job corpus.
+
+    ``items`` are the freshly fetched pages (already ingested by the page
+    loader); ``None`` means no data. Trending skills and growth come from the
+    decayed demand rollup when one exists; co-occurrence and per-location
+    leaders from the skills stored with the recent corpus, so nothing is
+    re-matched. The result is cached per canonical query until the corpus
+    gains postings. Falls back to the fetched items alone when the corpus is
+    unavailable.
+    """
+    if items is None:
+        return market_snapshot_from_items(role, None)
+    key = canonical_query(role, location)
+    # read before the corpus: a concurrent ingest then only invalidates early
+    generation = job_corpus.generation(role, location)
+    cached = corpus_snapshot_cache.get(key, generation)
+    if cached is not None:
+        return cached
+    corpus = job_corpus.recent(role, location)
+    if not corpus:
+        return market_snapshot_from_items(role, items)
+    matrix = TrendMatrix.from_skill_sets(
+        corpus_skill_sets(corpus), _SKILL_KEYS,
+        locations=[_posting_from_item(doc)["location"] for doc in corpus],
+    )
+    demand = demand_rollups.read(role, location)
+    # openings are extrapolated from one full fetch worth of postings, as before
+    sample_size = min(len(corpus), settings.MARKET_SNAPSHOT_PAGES * 10)
+    snapshot = {
+        **trend_report_from_matrix(role, matrix, demand["trending_skills"] if demand else None),
+        **market_statistics_from_items(role, corpus, sample_size),
+    }
+    if demand and demand["growth_rate"] is not None:
+        snapshot["growth_rate"] = demand["growth_rate"]
+    corpus_snapshot_cache.put(key, generation, snapshot)
+    return snapshot
+
+
+async def _build_market_snapshot(role: str, location: str, refresh: bool = False) -> dict:
+    items = await fetch_job_items(role, location, settings.MARKET_SNAPSHOT_PAGES, refresh)
+    # skill matching is CPU-bound: keep it off the event loop
+    return await run_in_threadpool(market_snapshot_from_corpus, role, location, items)
+
+
+async def build_market_snapshot(role: str, location: str, refresh: bool = False) -> dict:
+    """Trend report and market statistics derived from a single fetch of the postings.
+
+    Concurrent requests for the same canonical (role, location) share one
+    in-flight build; each caller gets its own copy of the result. ``refresh``
+    bypasses the page cache (used by the precompute scheduler).
+    """
+    key = canonical_query(role, location)
+    snapshot = await snapshot_flight.do((*key, refresh), lambda: _build_market_snapshot(*key, refresh))
+    return copy.deepcopy(snapshot)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+from typing import Iterable, List, Tuple
+import asyncio
+import mmap
+import os
+import shutil
+import tempfile
+
+import pdfplumber
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+
+from backend.services.worker_pool import BoundedProcessPool
+from backend.utils.settings import settings
+
+
+class PdfTooLarge(ValueError):
+    """Raised when an upload exceeds the configured byte or page limits."""
+
+
+# room for the multipart boundaries and part headers around the PDF itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def _too_large(max_bytes: int) -> str:
+    return f"PDF exceeds the {max_bytes / (1024 * 1024):.1f} MB limit"
+
+
+class UploadSizeLimitMiddleware:
+    """Cap request bodies on upload paths while they are received.
+
+    Starlette reads and spools the whole multipart body before the endpoint
+    runs, so the limit has to sit in front of it: a declared Content-Length
+    over the limit is refused before anything is read, and chunked bodies are
+    counted as they stream in and cut off with 413 once they pass it.
+    """
+
+    def __init__(self, app, paths: Iterable[str], max_bytes: int) -> None:
+        self.app = app
+        self.paths = frozenset(paths)
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        limit = self.max_bytes + MULTIPART_OVERHEAD_BYTES
+        detail = _too_large(self.max_bytes)
+        declared = dict(scope.get("headers") or []).get(b"content-length", b"")
+        if declared.isdigit() and int(declared) > limit:
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+        started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # an HTTPException passes through FastAPI's body parsing unchanged
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        async def tracked_send(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except HTTPException as e:
+            if e.status_code != 413 or started:
+                raise
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+
+
+async def spool_upload(file: UploadFile, max_bytes: int) -> str:
+    """Copy a received upload to a named temporary file the worker processes can open.
+
+    The body size is capped while it is received (UploadSizeLimitMiddleware);
+    here only the PDF part's own size is checked. Returns the file path; the
+    caller owns it and must remove it. Workers open the path themselves, so
+    the PDF is never held in memory as one bytes object or pickled across
+    processes.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise PdfTooLarge(_too_large(max_bytes))
+    tmp = tempfile.NamedTemporaryFile(prefix="resume-", suffix=".pdf", delete=False)
+    try:
+        await file.seek(0)
+        await run_in_threadpool(shutil.copyfileobj, file.file, tmp)
+        tmp.close()
+        return tmp.name
+    except BaseException:
+        tmp.close()
+        remove_spooled(tmp.name)
+        raise
+
+
+def remove_spooled(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> Tuple[str, int]:
+    """Extract pages ``[start, stop)``; runs inside a resume worker process.
+
+    The file is memory-mapped when possible so pages are paged in on demand.
+    Returns the text together with the document's total page count so the
+    first task doubles as the page-limit probe.
+    """
+    parts: List[str] = []
+    with open(pdf_path, "rb") as fh:
+        try:
+            stream = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files cannot be mapped; let pdfplumber report them
+            stream = fh
+        try:
+            with pdfplumber.open(stream) as pdf:
+                total = len(pdf.pages)
+                for page in pdf.pages[start:stop]:
+                    text = page.extract_text()
+                    if text:
+                        parts.append(text + "\n")
+                    # drop the parsed layout objects as soon as the page is done
+                    page.close()
+        finally:
+            if stream is not fh:
+                stream.close()
+    return "".join(parts), total
+
+
+async def ingest_pdf(pdf_path: str, pool: BoundedProcessPool) -> str:
+    """Extract resume text from a PDF, spreading page ranges across ``pool``.
+
+    Enforces PDF_MAX_PAGES (the byte limit is applied on upload) and keeps
+    at least two page ranges in flight, more (up to half the workers) when
+    that many are idle, so concurrent uploads share the pool. Stops once
+    PDF_TEXT_TARGET_CHARS of text have been collected, since later pages
+    rarely change the extracted skills.
+    """
+    step = max(1, settings.PDF_PAGES_PER_TASK)
+    text, total = await pool.run(extract_page_range, pdf_path, 0, step)
+    if total > settings.PDF_MAX_PAGES:
+        raise PdfTooLarge(f"PDF has {total} pages, limit is {settings.PDF_MAX_PAGES}")
+
+    parts = [text]
+    captured = len(text)
+    starts = iter(range(step, total, step))
+    pending: List[asyncio.Task] = []
+
+    def launch() -> bool:
+        start = next(starts, None)
+        if start is None:
+            return False
+        pending.append(asyncio.create_task(pool.run(extract_page_range, pdf_path, start, start + step)))
+        return True
+
+    idle = pool.max_workers - pool.inflight
+    fanout = max(2, min(pool.max_workers // 2, idle))
+    try:
+        while len(pending) < fanout and launch():
+            pass
+        # consume in page order so the early stop keeps the leading pages
+        while pending and captured < settings.PDF_TEXT_TARGET_CHARS:
+            text, _ = await pending.pop(0)
+            parts.append(text)
+            captured += len(text)
+            launch()
+    finally:
+        for task in pending:
+            task.cancel()
+    return "".join(parts)
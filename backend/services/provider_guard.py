@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Callable, Dict, Optional
+import time
+
+
+class QuotaBudget:
+    """Per-minute and per-day call budget for a metered API (0 disables a limit).
+
+    Windows are fixed (wall-clock minute, UTC day), matching how RapidAPI
+    counts quota. ``try_acquire`` spends one call or refuses without waiting.
+    """
+
+    def __init__(self, per_minute: int = 0, per_day: int = 0,
+                 clock: Callable[[], float] = time.time) -> None:
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self._clock = clock
+        self._minute = (-1, 0)
+        self._day = (-1, 0)
+        self.rejected = 0
+
+    def _windows(self):
+        now = self._clock()
+        minute, day = int(now // 60), int(now // 86400)
+        if self._minute[0] != minute:
+            self._minute = (minute, 0)
+        if self._day[0] != day:
+            self._day = (day, 0)
+
+    def try_acquire(self) -> bool:
+        self._windows()
+        if (self.per_minute and self._minute[1] >= self.per_minute) or (self.per_day and self._day[1] >= self.per_day):
+            self.rejected += 1
+            return False
+        self._minute = (self._minute[0], self._minute[1] + 1)
+        self._day = (self._day[0], self._day[1] + 1)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        self._windows()
+        return {
+            "minute_used": self._minute[1],
+            "per_minute": self.per_minute,
+            "day_used": self._day[1],
+            "per_day": self.per_day,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreaker:
+    """Closed -> open after ``failure_threshold`` consecutive failures or a 429.
+
+    While open, ``allow`` refuses immediately so callers go straight to their
+    fallback. After ``reset_timeout`` seconds (or the provider's Retry-After)
+    a single half-open probe is let through: success closes the breaker,
+    failure opens it again.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._open_until = 0.0
+        self._probing = False
+        self.short_circuited = 0
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self._clock() >= self._open_until:
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def release(self) -> None:
+        """Give back an allowed call that was never made (e.g. no budget left)."""
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold or retry_after is not None:
+            self.trip(retry_after)
+
+    def trip(self, retry_after: Optional[float] = None) -> None:
+        self.state = self.OPEN
+        self._probing = False
+        self._open_until = self._clock() + max(self.reset_timeout, retry_after or 0.0)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "open_for_seconds": round(max(0.0, self._open_until - self._clock()), 1) if self.state == self.OPEN else 0.0,
+            "short_circuited": self.short_circuited,
+        }
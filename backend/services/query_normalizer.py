@@ -0,0 +1,145 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+from functools import lru_cache
+import re
+
+from rapidfuzz import fuzz, process
+
+from backend.services.career_catalog import get_catalog
+
+ROLE_FUZZY_THRESHOLD = 88
+
+# other names of the same job market -> catalog role (roles_skills.json). Only
+# true synonyms and abbreviations: related but distinct titles (web developer,
+# cloud engineer, product designer, ...) are separate markets and stay as typed.
+# Spacing/punctuation variants, plurals, seniority and "dev"/"eng" are handled
+# in normalize_role.
+ROLE_ALIASES: Dict[str, List[str]] = {
+    "Frontend Developer": ["frontend engineer", "frontend", "frontend web developer"],
+    "Backend Developer": ["backend engineer", "backend", "server side developer"],
+    "Full Stack Developer": ["full stack engineer", "full stack"],
+    "ML Engineer": ["machine learning engineer"],
+    "DevOps Engineer": ["devops"],
+    "Mobile Developer": ["mobile app developer", "mobile engineer"],
+    "Medical Doctor": ["physician"],
+    "Registered Nurse": ["rn"],
+    "Medical Lab Technician": ["medical laboratory technician", "mlt"],
+    "High School Teacher": ["secondary school teacher"],
+    "University Professor": ["college professor"],
+    "UI/UX Designer": ["ux ui designer"],
+    "Technical Writer": ["tech writer"],
+    "Sales Engineer": ["presales engineer"],
+}
+
+# free-text spellings -> canonical location
+LOCATION_ALIASES: Dict[str, List[str]] = {
+    "New York, NY": ["nyc", "new york", "new york city", "new york ny", "ny ny", "manhattan"],
+    "San Francisco, CA": ["sf", "san francisco", "san fran", "bay area", "sf bay area", "san francisco bay area"],
+    "Los Angeles, CA": ["la", "los angeles", "l a"],
+    "Seattle, WA": ["seattle"],
+    "Austin, TX": ["austin"],
+    "Boston, MA": ["boston"],
+    "Chicago, IL": ["chicago", "chi"],
+    "Denver, CO": ["denver"],
+    "Atlanta, GA": ["atlanta", "atl"],
+    "Washington, DC": ["dc", "washington dc", "washington d c"],
+    "London, UK": ["london", "london england", "london united kingdom"],
+    "Bengaluru, India": ["bangalore", "bengaluru", "blr", "bangalore india"],
+    "United States": ["us", "usa", "u s", "u s a", "united states of america", "america"],
+    "Remote": ["remote", "anywhere", "work from home", "wfh", "remote only", "fully remote"],
+}
+
+# dropped before matching: "Senior Front-end Dev" is the Frontend Developer market
+_SENIORITY = {"senior", "sr", "junior", "jr", "lead", "principal", "staff", "entry", "level",
+              "mid", "associate", "intern", "i", "ii", "iii"}
+_ABBREVIATIONS = {"dev": "developer", "devs": "developer", "eng": "engineer", "engr": "engineer",
+                  "mgr": "manager", "admin": "administrator", "tech": "technician"}
+
+
+def _words(text: str) -> List[str]:
+    return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).split()
+
+
+def _compact(words: List[str]) -> str:
+    # spacing and punctuation agnostic: "front-end", "front end" and "frontend" agree
+    return "".join(words)
+
+
+def _singular(words: List[str]) -> List[str]:
+    # "Backend Developers" is the Backend Developer market
+    if words and len(words[-1]) > 3 and words[-1].endswith("s") and not words[-1].endswith("ss"):
+        return [*words[:-1], words[-1][:-1]]
+    return words
+
+
+def _role_index() -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for role in get_catalog().role_names:
+        index.setdefault(_compact(_words(role)), role)
+    for role, aliases in ROLE_ALIASES.items():
+        for alias in aliases:
+            index.setdefault(_compact(_words(alias)), role)
+    return index
+
+
+def _role_choices(roles: List[str]) -> Dict[int, Dict[str, str]]:
+    # fuzzy matching only forgives typos: candidates have as many words as the query,
+    # so "UX Designer" or "Product Designer" never land on "UI/UX Designer"
+    choices: Dict[int, Dict[str, str]] = {}
+    for role in roles:
+        words = _words(role)
+        choices.setdefault(len(words), {})[" ".join(words)] = role
+    return choices
+
+
+_ROLE_INDEX = _role_index()
+_ROLE_CHOICES = _role_choices(list(dict.fromkeys(_ROLE_INDEX.values())))
+
+
+def _location_index() -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for location, aliases in LOCATION_ALIASES.items():
+        # "City, ST" locations also match every alias with the state: "LA, CA"
+        region = location.split(", ")[1] if ", " in location else ""
+        for alias in [location, *aliases]:
+            index[_compact(_words(alias))] = location
+            if region:
+                index.setdefault(_compact(_words(f"{alias} {region}")), location)
+    return index
+
+
+_LOCATION_INDEX = _location_index()
+
+
+@lru_cache(maxsize=4096)
+def normalize_role(role: str) -> str:
+    """Catalog role for a free-text role, or the whitespace-collapsed input when none fits."""
+    words = _words(role)
+    core = [w for w in words if w not in _SENIORITY] or words
+    expanded_words = [_ABBREVIATIONS.get(w, w) for w in core]
+    for candidate in (words, core, expanded_words, _singular(expanded_words)):
+        match = _ROLE_INDEX.get(_compact(candidate))
+        if match:
+            return match
+    query = _singular(expanded_words)
+    choices = _ROLE_CHOICES.get(len(query))
+    if choices:
+        best = process.extractOne(" ".join(query), choices.keys(), scorer=fuzz.token_sort_ratio,
+                                  score_cutoff=ROLE_FUZZY_THRESHOLD)
+        if best:
+            return choices[best[0]]
+    return " ".join((role or "").split())
+
+
+@lru_cache(maxsize=4096)
+def normalize_location(location: str) -> str:
+    """Canonical location for a free-text location ("NYC" -> "New York, NY")."""
+    match = _LOCATION_INDEX.get(_compact(_words(location)))
+    if match:
+        return match
+    return re.sub(r"\s*,\s*", ", ", " ".join((location or "").split())).strip(", ")
+
+
+def normalize_query(role: str, location: str) -> Tuple[str, str]:
+    """Canonical (role, location) of a market query, in display form."""
+    return normalize_role(role), normalize_location(location)
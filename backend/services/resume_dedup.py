@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Set, Tuple
+from collections import OrderedDict
+import hashlib
+import threading
+
+import numpy as np
+
+from backend.services.resume_parser import normalize
+from backend.utils.db import get_db
+from backend.utils.settings import settings
+
+NUM_PERM = 64
+LSH_BANDS = 16  # 16 bands x 4 rows: ~99.9% chance to surface a pair with Jaccard 0.8
+_ROWS = NUM_PERM // LSH_BANDS
+_PRIME = (1 << 31) - 1
+# fixed seed: signatures are persisted and must stay comparable across restarts
+_rng = np.random.default_rng(20240601)
+_A = _rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.int64)
+_B = _rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.int64)
+
+
+def minhash_signature(resume_text: str) -> List[int]:
+    """MinHash over word 3-shingles taken within lines, so reordered bullets keep their shingles."""
+    shingles: Set[str] = set()
+    for line in resume_text.splitlines():
+        tokens = normalize(line).split()
+        shingles.update(" ".join(tokens[i:i + 3]) for i in range(max(1, len(tokens) - 2)))
+    shingles.discard("")
+    if not shingles:
+        shingles.add("")
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles),
+        dtype=np.int64, count=len(shingles),
+    )
+    return ((_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME).min(axis=1).tolist()
+
+
+def estimated_jaccard(a: List[int], b: List[int]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """Per-user LSH index of recent resume signatures and their section records.
+
+    Each user keeps the last ``per_user`` analyses; users are evicted LRU
+    beyond ``max_users``. A user's entries are loaded from the ``analyses``
+    collection the first time that user is looked up.
+    """
+
+    def __init__(self, threshold: float, per_user: int, max_users: int, collection: str = "analyses") -> None:
+        self.threshold = threshold
+        self.per_user = per_user
+        self.max_users = max_users
+        self.collection = collection
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # user -> entry ids, oldest first
+        self._users: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._entries: Dict[int, Tuple[str, List[int], Dict[str, dict]]] = {}
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[int]] = {}
+
+    @staticmethod
+    def _bands(signature: List[int]):
+        for band in range(LSH_BANDS):
+            yield band, tuple(signature[band * _ROWS:(band + 1) * _ROWS])
+
+    def _load(self, user_id: str) -> List[dict]:
+        if not settings.MONGODB_URI:
+            return []
+        try:
+            recs = list(
+                get_db()[self.collection]
+                .find({"user_id": user_id, "minhash": {"$exists": True}}, {"minhash": 1, "sections": 1})
+                .sort("created_at", -1)
+                .limit(self.per_user)
+            )
+        except Exception:
+            return []
+        return [rec for rec in recs if len(rec.get("minhash") or []) == NUM_PERM and rec.get("sections")]
+
+    def _warm(self, user_id: str) -> None:
+        with self._lock:
+            if user_id in self._users:
+                self._users.move_to_end(user_id)
+                return
+        recs = self._load(user_id)
+        with self._lock:
+            # an upload (or another warm) registered the user while we read: its entries are newer
+            if user_id in self._users:
+                return
+            self._users[user_id] = []
+            for rec in reversed(recs):
+                self._insert(user_id, rec["minhash"], rec["sections"])
+
+    def lookup(self, user_id: str, signature: List[int]) -> Optional[Dict[str, dict]]:
+        """Section records of the user's most similar prior resume, if similar enough."""
+        self._warm(user_id)
+        with self._lock:
+            candidates: Set[int] = set()
+            for band, key in self._bands(signature):
+                candidates |= self._buckets.get((user_id, band, key), set())
+            best, best_score = None, 0.0
+            for entry_id in candidates:
+                _, other, sections = self._entries[entry_id]
+                score = estimated_jaccard(signature, other)
+                if score > best_score:
+                    best, best_score = sections, score
+        if best is not None and best_score >= self.threshold:
+            print(f"Near-duplicate resume for user {user_id} (similarity ~{best_score:.2f})")
+            return best
+        return None
+
+    def add(self, user_id: str, signature: List[int], sections: Dict[str, dict]) -> None:
+        with self._lock:
+            self._insert(user_id, signature, sections)
+
+    def _insert(self, user_id: str, signature: List[int], sections: Dict[str, dict]) -> None:
+        # caller holds self._lock
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (user_id, signature, sections)
+        for band, key in self._bands(signature):
+            self._buckets.setdefault((user_id, band, key), set()).add(entry_id)
+        ids = self._users.setdefault(user_id, [])
+        self._users.move_to_end(user_id)
+        ids.append(entry_id)
+        while len(ids) > self.per_user:
+            self._drop(ids.pop(0))
+        while len(self._users) > self.max_users:
+            _, old_ids = self._users.popitem(last=False)
+            for old in old_ids:
+                self._drop(old)
+
+    def _drop(self, entry_id: int) -> None:
+        user_id, signature, _ = self._entries.pop(entry_id)
+        for band, key in self._bands(signature):
+            bucket = self._buckets.get((user_id, band, key))
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[(user_id, band, key)]
+
+
+near_duplicates = NearDuplicateIndex(
+    threshold=settings.RESUME_DEDUP_THRESHOLD,
+    per_user=settings.RESUME_DEDUP_PER_USER,
+    max_users=settings.RESUME_DEDUP_MAX_USERS,
+)
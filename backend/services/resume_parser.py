@@ -1,23 +1,32 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import re
-from rapidfuzz import fuzz
-import json
-from pathlib import Path
+import hashlib
+import threading
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data"
-SKILLS_DB_PATH = DATA_DIR / "skills_database.json"
+from backend.services.career_catalog import get_catalog
+from backend.services.skill_matcher import KeywordAutomaton, TrigramIndex
+from backend.utils.settings import settings
 
-# Try to load spaCy if available for better NER/lemmatization
-try:
-    import spacy
-    _nlp: Optional["spacy.Language"] = None
-    try:
-        _nlp = spacy.load("en_core_web_sm")
-    except Exception:
-        _nlp = None
-except Exception:
-    _nlp = None
+# spaCy is optional and loaded on first use (see _get_nlp) to keep cold starts fast
+_nlp: Optional["spacy.Language"] = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+
+def _get_nlp():
+    """Load the spaCy pipeline once, with only the components lemmatization needs."""
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                try:
+                    import spacy
+                    _nlp = spacy.load(settings.SPACY_MODEL, disable=["parser", "ner"])
+                except Exception:
+                    _nlp = None
+                _nlp_loaded = True
+    return _nlp
 
 
 def normalize(text: str) -> str:
@@ -25,62 +34,95 @@ def normalize(text: str) -> str:
 
 
 def load_skills_db() -> List[str]:
-    with open(SKILLS_DB_PATH, "r", encoding="utf-8") as f:
-        skills = json.load(f)
-    return [normalize(s) for s in skills]
+    return [normalize(s) for s in get_catalog().skills]
 
 _SKILLS_DB = set(load_skills_db())
+# bumps whenever skills_database.json changes, invalidating cached analyses
+SKILLS_DB_VERSION = get_catalog().skills_version
+# bump when the analysis output changes for the same input (invalidates cached analyses)
+ANALYZER_REVISION = 3
+# trigram index proposes the few skills worth a fuzzy score
+_SKILL_TRIGRAMS = TrigramIndex(_SKILLS_DB)
 
 
 def lemmatize(text: str) -> str:
-    if _nlp is None:
+    nlp = _get_nlp()
+    if nlp is None:
         return text
-    doc = _nlp(text)
+    doc = nlp(text)
     return " ".join([t.lemma_ for t in doc])
 
 
-def extract_skills(resume_text: str) -> List[str]:
-    text = normalize(resume_text)
-    text = lemmatize(text)
+def lemmatize_many(texts: List[str]) -> List[str]:
+    """Lemmatize several texts through ``nlp.pipe`` instead of one call per text."""
+    nlp = _get_nlp()
+    if nlp is None:
+        return list(texts)
+    docs = nlp.pipe(texts, batch_size=settings.SPACY_BATCH_SIZE, n_process=settings.SPACY_N_PROCESS)
+    return [" ".join([t.lemma_ for t in doc]) for doc in docs]
 
-    found: set[str] = set()
 
-    # direct exact token match
-    tokens = set(re.split(r"[^a-z0-9+.#]+", text))
-    
-    print(f"\n=== RESUME SKILL EXTRACTION DEBUG ===")
-    print(f"Raw text length: {len(resume_text)} chars")
-    print(f"Normalized text sample: {text[:200]}...")
-    print(f"Total tokens extracted: {len(tokens)}")
-    
-    for skill in _SKILLS_DB:
-        # skills with spaces handle separately
-        if " " in skill:
-            if skill in text:
-                found.add(skill)
-                print(f"  ✓ Exact match (multi-word): {skill}")
-        else:
-            if skill in tokens:
-                found.add(skill)
-                print(f"  ✓ Exact match (single): {skill}")
-
-    # fuzzy match for near misses - LOWERED THRESHOLD for better matching
-    fuzzy_matches = 0
-    for skill in _SKILLS_DB:
-        if skill in found:
+# Resume section headings. Skills/experience/projects are "skill-bearing" and
+# get fuzzy matching; the other headings only close the preceding section.
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "skills": ["skills", "technical skills", "key skills", "core skills", "core competencies",
+               "technologies", "tech stack", "tools and technologies", "skills and tools"],
+    "experience": ["experience", "work experience", "professional experience", "employment history",
+                   "work history", "employment", "internships", "internship"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects", "selected projects"],
+    "education": ["education", "academic background", "academic qualifications", "education and training"],
+    "other": ["summary", "professional summary", "profile", "objective", "career objective",
+              "certifications", "certificates", "achievements", "awards", "publications", "references",
+              "contact", "contact information", "personal details", "languages", "interests", "hobbies",
+              "volunteer experience", "volunteering", "declaration"],
+}
+SKILL_BEARING_SECTIONS = ("skills", "experience", "projects")
+
+_HEADING_TO_SECTION = {h: name for name, heads in SECTION_HEADINGS.items() for h in heads}
+# a heading is a short line holding only the heading, or the heading followed by ":" and content
+_HEADING_RE = re.compile(
+    r"^[\s#*•·\-–|]*("
+    + "|".join(r"\s+".join(map(re.escape, h.split())) for h in sorted(_HEADING_TO_SECTION, key=len, reverse=True))
+    + r")\s*(?::\s*(.*)|[\s:\-–]*$)",
+    re.IGNORECASE,
+)
+
+
+def segment_sections(resume_text: str) -> Dict[str, str]:
+    """Split a resume into sections by heading lines.
+
+    Text before the first heading is returned as ``"header"``. Repeated
+    sections are concatenated. Returns ``{"header": text}`` when no headings
+    are found.
+    """
+    sections: Dict[str, List[str]] = {}
+    current = "header"
+    for line in resume_text.splitlines():
+        m = _HEADING_RE.match(line) if len(line) <= 80 or ":" in line[:40] else None
+        if m:
+            current = _HEADING_TO_SECTION[normalize(m.group(1))]
+            if m.group(2):
+                sections.setdefault(current, []).append(m.group(2))
             continue
-        score = fuzz.partial_ratio(skill, text)
-        # Lowered from 90 to 75 for better coverage
-        if score >= 75:
-            found.add(skill)
-            fuzzy_matches += 1
-            if fuzzy_matches <= 10:  # Show first 10 fuzzy matches
-                print(f"  ✓ Fuzzy match ({score}%): {skill}")
-
-    # title-case and dedupe for UI
-    result = sorted({s.replace("node.js", "Node.js").replace("three.js", "Three.js").replace("vue.js", "Vue.js").title() for s in found})
-    
+        sections.setdefault(current, []).append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def education_entries(sections: Dict[str, str], limit: int = 5) -> Optional[List[str]]:
+    if "education" not in sections:
+        return None
+    entries = [line.strip(" \t•·*-–|") for line in sections["education"].splitlines()]
+    entries = [e[:200] for e in entries if e]
+    return entries[:limit] or None
+
+
+def extract_skills(resume_text: str, fuzzy_threshold: Optional[float] = None) -> List[str]:
+    """Catalog skills of a resume, as in its full analysis (see ``ResumeFeatureExtractor.extract``)."""
+    result = _EXTRACTOR.extract(resume_text, fuzzy_threshold)["skills"]
+
     # DEBUG: Print extracted skills
+    print(f"\n=== RESUME SKILL EXTRACTION DEBUG ===")
+    print(f"Raw text length: {len(resume_text)} chars")
     print(f"Total skills found: {len(result)}")
     print(f"Skills: {result}")
     print(f"====================================\n")
@@ -88,34 +130,222 @@ def extract_skills(resume_text: str) -> List[str]:
     return result
 
 
+def _format_skills(found: set[str]) -> List[str]:
+    return sorted({s.replace("node.js", "Node.js").replace("three.js", "Three.js").replace("vue.js", "Vue.js").title() for s in found})
+
+
+# Role keywords; a role scores one point per distinct keyword present in the resume.
+ROLE_KEYWORDS: Dict[str, List[str]] = {
+    "Frontend Developer": ["frontend", "react", "vue", "angular", "html", "css", "typescript", "jsx"],
+    "Backend Developer": ["backend", "fastapi", "django", "node.js", "express", "java", "spring", "microservice"],
+    "Full Stack Developer": ["full stack", "mern", "mean", "full-stack"],
+    "Data Scientist": ["data scientist", "data science", "machine learning", "ml", "nlp", "pandas", "numpy", "scikit"],
+    "ML Engineer": ["ml engineer", "machine learning engineer", "mlops", "tensorflow", "pytorch"],
+    "DevOps Engineer": ["devops", "kubernetes", "docker", "ci/cd", "jenkins", "terraform"],
+    "Cloud Engineer": ["cloud engineer", "aws", "azure", "gcp", "cloud architect"],
+    "Database Administrator": ["database", "dba", "sql", "mongodb", "postgresql"],
+    "Solutions Architect": ["architect", "solution architect", "system design"],
+    "QA Engineer": ["qa engineer", "qa", "testing", "selenium", "test automation"],
+}
+
+# Experience phrasings in priority order: the first pattern whose first match is sane wins.
+_EXPERIENCE_PATTERNS = [
+    r"(\d+)\s+years?(?:\s+of)?\s+experience",  # "5 years experience"
+    r"(?:with|over|about|around|approximately)\s+(\d+)\s+years?",  # "with 5 years"
+    r"(\d+)\s+year\+",  # "5 year+"
+    r"total\s+(\d+)\s+years?",  # "total 5 years"
+]
+# All patterns in one scan: at every position where some pattern could start,
+# each pattern is tried as an independent lookahead with its own group.
+_EXPERIENCE_RE = re.compile(
+    r"(?=\d|with|over|about|around|approximately|total)"
+    + "".join(f"(?:(?={p})|)" for p in _EXPERIENCE_PATTERNS)
+)
+
+
+class ResumeFeatureExtractor:
+    """Computes skills, role and experience from one normalized copy of a resume.
+
+    Catalog skills (whole-word) and role keywords (plain substrings, as the
+    role heuristic always used) share one compiled automaton, so a single pass
+    yields both; experience comes from one precompiled regex scan and the fuzzy
+    skill stage from the trigram index.
+    """
+
+    def __init__(self, skills: Iterable[str], role_keywords: Dict[str, List[str]], fuzzy_index: TrigramIndex) -> None:
+        self._role_keywords = role_keywords
+        self._fuzzy_index = fuzzy_index
+        self._automaton = KeywordAutomaton()
+        for skill in skills:
+            self._automaton.add(skill, ("skill", skill))
+        for kw in {kw for kws in role_keywords.values() for kw in kws}:
+            self._automaton.add(kw, ("role", kw), whole_word=False)
+        self._automaton.compile()
+
+    def scan(self, text: str, skills: bool = True) -> Tuple[set, set]:
+        """Return ``(exact skills, role keywords)`` found in normalized ``text``."""
+        found_skills: set[str] = set()
+        found_keywords: set[str] = set()
+        for _, _, (kind, value) in self._automaton.iter_matches(text):
+            if kind == "role":
+                found_keywords.add(value)
+            elif skills:
+                found_skills.add(value)
+        return found_skills, found_keywords
+
+    def best_role(self, keywords: set) -> Tuple[Optional[str], int]:
+        best, best_score = None, 0
+        for role, kws in self._role_keywords.items():
+            score = sum(1 for kw in kws if kw in keywords)
+            if score > best_score:
+                best, best_score = role, score
+        return best, best_score
+
+    @staticmethod
+    def experience_years(text: str) -> Optional[int]:
+        firsts: List[Optional[str]] = [None] * len(_EXPERIENCE_PATTERNS)
+        for m in _EXPERIENCE_RE.finditer(text):
+            for i, value in enumerate(m.groups()):
+                if value is not None and firsts[i] is None:
+                    firsts[i] = value
+            if all(v is not None for v in firsts):
+                break
+        for value in firsts:
+            if value is not None and 0 < int(value) <= 70:  # Sanity check
+                return int(value)
+        return None
+
+    def fuzzy_skills(self, text: str, exclude: set, fuzzy_threshold: Optional[float] = None) -> Dict[str, float]:
+        threshold = settings.SKILL_FUZZY_THRESHOLD if fuzzy_threshold is None else fuzzy_threshold
+        return self._fuzzy_index.match(text, threshold=threshold, exclude=exclude)
+
+    def extract(self, resume_text: str, fuzzy_threshold: Optional[float] = None) -> dict:
+        """Full analysis shaped like AnalyzeResumeResponse.
+
+        Runs the per-section engine of ``extract_incremental`` with nothing to
+        reuse, so a resume analyzed either way gets the same (cacheable) result.
+        """
+        return self.extract_incremental(resume_text, None, fuzzy_threshold)[0]
+
+    def extract_incremental(
+        self, resume_text: str, previous: Optional[Dict[str, dict]] = None, fuzzy_threshold: Optional[float] = None,
+    ) -> Tuple[dict, Dict[str, dict], int]:
+        """Analyze section by section, reusing ``previous`` records whose section is unchanged.
+
+        Every section is matched exactly; skill-bearing sections (or all of
+        them when none were found) also fuzzily. Returns ``(analysis,
+        section_records, reused_count)``. Records hold the section digest,
+        skills and role keywords, so they can be stored and handed back for
+        the next version of the same resume. Experience and education are
+        cheap and always recomputed.
+        """
+        return self.extract_many([resume_text], [previous], fuzzy_threshold)[0]
+
+    def extract_many(
+        self, resume_texts: List[str], previous: Optional[List[Optional[Dict[str, dict]]]] = None,
+        fuzzy_threshold: Optional[float] = None,
+    ) -> List[Tuple[dict, Dict[str, dict], int]]:
+        """``extract_incremental`` for several resumes.
+
+        Each resume is segmented once and the sections left to analyze, across
+        all resumes, are lemmatized in one ``lemmatize_many`` pass.
+        """
+        threshold = settings.SKILL_FUZZY_THRESHOLD if fuzzy_threshold is None else fuzzy_threshold
+        plans = []
+        pending: List[str] = []
+        for i, resume_text in enumerate(resume_texts):
+            sections = segment_sections(resume_text)
+            fuzzy_all = not any(name in sections for name in SKILL_BEARING_SECTIONS)
+            prior_records = (previous[i] if previous else None) or {}
+            entries = []
+            for name, raw in sections.items():
+                fuzzy = fuzzy_all or name in SKILL_BEARING_SECTIONS
+                digest = section_digest(raw, fuzzy, threshold)
+                prior = prior_records.get(name)
+                if prior and prior.get("hash") == digest:
+                    entries.append((name, prior, None))
+                else:
+                    entries.append((name, (digest, fuzzy), len(pending)))
+                    pending.append(normalize(raw))
+            plans.append((resume_text, sections, entries))
+
+        lemmas = lemmatize_many(pending)
+        results = []
+        for resume_text, sections, entries in plans:
+            records: Dict[str, dict] = {}
+            reused = 0
+            for name, value, idx in entries:
+                if idx is None:
+                    records[name] = value
+                    reused += 1
+                    continue
+                digest, fuzzy = value
+                text, lemma = pending[idx], lemmas[idx]
+                # without spaCy the lemmatized text is the normalized text: one pass for everything
+                skills, keywords = self.scan(text, skills=lemma is text)
+                if lemma is not text:
+                    skills, _ = self.scan(lemma)
+                if fuzzy:
+                    skills |= set(self.fuzzy_skills(lemma, skills, threshold))
+                records[name] = {"hash": digest, "skills": sorted(skills), "keywords": sorted(keywords)}
+
+            skills = {s for r in records.values() for s in r["skills"]}
+            keywords = {k for r in records.values() for k in r["keywords"]}
+            analysis = {
+                "skills": _format_skills(skills),
+                "current_role": self.best_role(keywords)[0],
+                "experience_years": self.experience_years(normalize(resume_text)),
+                "education": education_entries(sections),
+            }
+            results.append((analysis, records, reused))
+        return results
+
+
+def section_digest(section_text: str, fuzzy: bool, threshold: Optional[float] = None) -> str:
+    """Order-insensitive digest of a section, so reordered bullets still match."""
+    if threshold is None:
+        threshold = settings.SKILL_FUZZY_THRESHOLD
+    lines = sorted(line for line in (normalize(l) for l in section_text.splitlines()) if line)
+    payload = f"{SKILLS_DB_VERSION}:{ANALYZER_REVISION}:{int(fuzzy)}:{threshold:g}\n" + "\n".join(lines)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+_EXTRACTOR = ResumeFeatureExtractor(_SKILLS_DB, ROLE_KEYWORDS, _SKILL_TRIGRAMS)
+
+
+def analyze_resume_text(resume_text: str) -> dict:
+    """Full single-resume analysis, shaped like AnalyzeResumeResponse."""
+    analysis = _EXTRACTOR.extract(resume_text)
+    print(f"Resume analysis: {len(analysis['skills'])} skills, role={analysis['current_role']}, "
+          f"experience={analysis['experience_years']}")
+    return analysis
+
+
+def analyze_resume_incremental(resume_text: str, previous_sections: Optional[Dict[str, dict]] = None) -> dict:
+    """Per-section analysis patched from a near-duplicate's stored sections, if given."""
+    analysis, sections, reused = _EXTRACTOR.extract_incremental(resume_text, previous_sections)
+    print(f"Resume analysis: {len(analysis['skills'])} skills, role={analysis['current_role']}, "
+          f"experience={analysis['experience_years']} ({reused}/{len(sections)} sections reused)")
+    return {"analysis": analysis, "sections": sections, "reused": reused}
+
+
+def iter_resume_analyses(resume_texts: List[str], chunk_size: int = 16) -> Iterator[Tuple[int, dict]]:
+    """Yield ``(index, analysis)`` per resume, one chunk of resumes at a time.
+
+    Analyses are the same as ``analyze_resume_text``'s; each chunk shares one
+    lemmatization pass.
+    """
+    for start in range(0, len(resume_texts), chunk_size):
+        chunk = resume_texts[start:start + chunk_size]
+        for offset, (analysis, _, _) in enumerate(_EXTRACTOR.extract_many(chunk)):
+            yield start + offset, analysis
+
+
 def guess_current_role(resume_text: str) -> Optional[str]:
-    text = resume_text.lower()
-    
-    # More comprehensive role detection
-    role_patterns = {
-        "Frontend Developer": ["frontend", "react", "vue", "angular", "html", "css", "typescript", "jsx"],
-        "Backend Developer": ["backend", "fastapi", "django", "node.js", "express", "java", "spring", "microservice"],
-        "Full Stack Developer": ["full stack", "mern", "mean", "full-stack"],
-        "Data Scientist": ["data scientist", "data science", "machine learning", "ml", "nlp", "pandas", "numpy", "scikit"],
-        "ML Engineer": ["ml engineer", "machine learning engineer", "mlops", "tensorflow", "pytorch"],
-        "DevOps Engineer": ["devops", "kubernetes", "docker", "ci/cd", "jenkins", "terraform"],
-        "Cloud Engineer": ["cloud engineer", "aws", "azure", "gcp", "cloud architect"],
-        "Database Administrator": ["database", "dba", "sql", "mongodb", "postgresql"],
-        "Solutions Architect": ["architect", "solution architect", "system design"],
-        "QA Engineer": ["qa engineer", "qa", "testing", "selenium", "test automation"],
-    }
-    
-    # Score each role based on keyword matches
-    role_scores = {}
-    for role, keywords in role_patterns.items():
-        score = sum(1 for kw in keywords if kw in text)
-        if score > 0:
-            role_scores[role] = score
-    
-    # Return highest scoring role
-    if role_scores:
-        best_role = max(role_scores, key=role_scores.get)
-        print(f"Detected role: {best_role} (score: {role_scores[best_role]})")
+    _, keywords = _EXTRACTOR.scan(normalize(resume_text), skills=False)
+    best_role, score = _EXTRACTOR.best_role(keywords)
+    if best_role:
+        print(f"Detected role: {best_role} (score: {score})")
         return best_role
     
     print("No role detected")
@@ -124,26 +354,9 @@ def guess_current_role(resume_text: str) -> Optional[str]:
 
 def extract_experience_years(resume_text: str) -> Optional[int]:
     """Extract years of experience from resume text"""
-    text = resume_text.lower()
-    
-    # Try multiple patterns for experience extraction
-    patterns = [
-        r"(\d+)\s+years?(?:\s+of)?\s+experience",  # "5 years experience"
-        r"(?:with|over|about|around|approximately)\s+(\d+)\s+years?",  # "with 5 years"
-        r"(\d+)\s+year\+",  # "5 year+"
-        r"total\s+(\d+)\s+years?",  # "total 5 years"
-    ]
-    
-    for pattern in patterns:
-        m = re.search(pattern, text)
-        if m:
-            try:
-                years = int(m.group(1))
-                if 0 < years <= 70:  # Sanity check
-                    print(f"Extracted experience: {years} years (pattern: {pattern})")
-                    return years
-            except ValueError:
-                continue
-    
-    print("No experience pattern found")
-    return None
+    years = _EXTRACTOR.experience_years(normalize(resume_text))
+    if years is not None:
+        print(f"Extracted experience: {years} years")
+    else:
+        print("No experience pattern found")
+    return years
@@ -1,35 +1,18 @@
 from __future__ import annotations
 from typing import List, Dict
-from pathlib import Path
-import json
 import random
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data"
-ROLES_SKILLS_PATH = DATA_DIR / "roles_skills.json"
-COURSES_DB_PATH = DATA_DIR / "courses_database.json"
-
-with open(ROLES_SKILLS_PATH, "r", encoding="utf-8") as f:
-    ROLES_SKILLS = json.load(f)
-
-# Load courses database
-try:
-    with open(COURSES_DB_PATH, "r", encoding="utf-8") as f:
-        COURSES_DB = json.load(f)
-except FileNotFoundError:
-    COURSES_DB = {}
+from backend.services.career_catalog import get_catalog
 
 
 def load_required_skills(target_role: str) -> List[str]:
-    for entry in ROLES_SKILLS:
-        if entry.get("role", "").lower() == target_role.lower():
-            return [s.title() for s in entry.get("required_skills", [])]
-    # fallback: empty
-    return []
+    # empty for roles outside the catalog
+    return [s.title() for s in get_catalog().required_skills(target_role)]
 
 
 def get_courses_for_role(target_role: str, skills: List[str]) -> List[Dict]:
     """Get relevant courses from database for the target role"""
-    role_courses = COURSES_DB.get(target_role, [])
+    role_courses = get_catalog().courses_for_role(target_role)
     
     if not role_courses:
         # Fallback to generic courses
@@ -1,7 +1,8 @@
 import google.generativeai as genai
 from typing import Dict, List, Any
 import json
-from pathlib import Path
+
+from backend.services.career_catalog import get_catalog
 
 
 class RoleDiscoveryService:
@@ -41,24 +42,9 @@ class RoleDiscoveryService:
             self.roles_data = {}
     
     def _load_roles_data(self) -> Dict[str, Any]:
-        """Load available roles and their skill requirements."""
+        """Available roles and their skill requirements, from the shared career catalog."""
         try:
-            base_path = Path(__file__).parent.parent / "data"
-            with open(base_path / "roles_skills.json", "r") as f:
-                raw_data = json.load(f)
-
-            if isinstance(raw_data, dict):
-                return raw_data
-
-            if isinstance(raw_data, list):
-                normalized = {}
-                for item in raw_data:
-                    role_name = item.get("role")
-                    if role_name:
-                        normalized[role_name] = item
-                return normalized
-
-            return {}
+            return get_catalog().roles_by_name
         except Exception as e:
             print(f"Error loading roles data: {e}")
             return {}
@@ -302,7 +288,7 @@ class RoleDiscoveryService:
             questions = self.get_discovery_questions()
             
             # Get ALL available roles from comprehensive database
-            if isinstance(self.roles_data, dict) and self.roles_data:
+            if self.roles_data:
                 available_roles = list(self.roles_data.keys())
             else:
                 # Extended fallback list with more roles
@@ -0,0 +1,200 @@
+from __future__ import annotations
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+from collections import Counter, deque
+import math
+import re
+
+from rapidfuzz import fuzz
+
+# Characters that belong to a skill token. "+" and "#" keep "c++" and "c#"
+# intact; "." only counts when it joins two token characters ("node.js").
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
+
+
+def _is_token_char(text: str, i: int) -> bool:
+    if i < 0 or i >= len(text):
+        return False
+    ch = text[i]
+    if ch in _TOKEN_CHARS:
+        return True
+    if ch == ".":
+        # dotted names ("node.js", "asp.net") vs sentence punctuation ("python.")
+        return (i + 1 < len(text) and text[i + 1] in _TOKEN_CHARS
+                and i > 0 and text[i - 1] in _TOKEN_CHARS)
+    return False
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton matching many phrases in a single pass over a text.
+
+    Phrases are expected to be normalized (lowercase, single spaces). Matches
+    flagged ``whole_word`` are only reported when they are not glued to
+    neighbouring token characters, so "java" does not fire inside "javascript"
+    and "c" does not fire inside "c++".
+    """
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # per state: (phrase, payload, whole_word) for every phrase ending here
+        self._out: List[List[Tuple[str, object, bool]]] = [[]]
+        self._compiled = False
+
+    def add(self, phrase: str, payload: object = None, whole_word: bool = True) -> None:
+        if not phrase:
+            return
+        state = 0
+        for ch in phrase:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((phrase, phrase if payload is None else payload, whole_word))
+        self._compiled = False
+
+    def compile(self) -> "KeywordAutomaton":
+        """Build failure links (breadth-first) and merge outputs along them."""
+        queue: deque[int] = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._compiled = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, object]]:
+        """Yield ``(start, end, payload)`` for every accepted match in ``text``."""
+        if not self._compiled:
+            self.compile()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            for phrase, payload, whole_word in out[state]:
+                start = end - len(phrase)
+                if whole_word and (_is_token_char(text, start - 1) or _is_token_char(text, end)):
+                    continue
+                yield start, end, payload
+
+    def find_all(self, text: str) -> Set[object]:
+        return {payload for _, _, payload in self.iter_matches(text)}
+
+
+def build_skill_matcher(skills: Iterable[str]) -> KeywordAutomaton:
+    """Compile a whole-word automaton over the (already normalized) skill catalog."""
+    automaton = KeywordAutomaton()
+    for skill in skills:
+        automaton.add(skill)
+    return automaton.compile()
+
+
+# Tokens as they appear in skills and resumes; dotted names stay whole.
+_TERM_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+
+def _trigrams(term: str) -> Set[str]:
+    # padded so a typo in a short term still leaves its edges to match
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Character-trigram inverted index proposing fuzzy-match candidates.
+
+    Skills are split into terms and every term of three or more characters is
+    indexed by its trigrams. Each distinct token of a text is looked up once;
+    a skill becomes a candidate when every indexed term shares at least
+    ``min_overlap`` of its trigrams with some token. Only candidates are then
+    scored with rapidfuzz, so the cost follows the resume's vocabulary rather
+    than catalog size times text length. Skills without such terms ("go",
+    "ci/cd") are left to exact matching.
+    """
+
+    def __init__(self, skills: Iterable[str], min_overlap: float = 0.34) -> None:
+        self.min_overlap = min_overlap
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._required: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._skill_terms: Dict[str, FrozenSet[int]] = {}
+        for skill in sorted(set(skills)):
+            ids = frozenset(self._add_term(t) for t in _TERM_RE.findall(skill) if len(t) >= 3)
+            if ids:
+                self._skill_terms[skill] = ids
+
+    def _add_term(self, term: str) -> int:
+        idx = self._term_ids.get(term)
+        if idx is not None:
+            return idx
+        idx = len(self._terms)
+        self._terms.append(term)
+        self._term_ids[term] = idx
+        grams = _trigrams(term)
+        self._required.append(max(1, math.ceil(len(grams) * self.min_overlap)))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(idx)
+        return idx
+
+    def _hit_terms(self, text: str) -> Dict[int, List[str]]:
+        """Map each indexed term to the distinct text tokens that resemble it."""
+        hit: Dict[int, List[str]] = {}
+        for token in set(_TERM_RE.findall(text)):
+            if len(token) < 3:
+                continue
+            counts: Counter[int] = Counter()
+            for gram in _trigrams(token):
+                ids = self._postings.get(gram)
+                if ids:
+                    counts.update(ids)
+            for idx, n in counts.items():
+                if n >= self._required[idx]:
+                    hit.setdefault(idx, []).append(token)
+        return hit
+
+    def _candidates(self, text: str, exclude: Iterable[str]) -> Iterator[Tuple[str, FrozenSet[int], Dict[int, List[str]]]]:
+        hit = self._hit_terms(text)
+        skip = set(exclude)
+        for skill, ids in self._skill_terms.items():
+            if skill not in skip and all(i in hit for i in ids):
+                yield skill, ids, hit
+
+    def match(self, text: str, threshold: float = 75, exclude: Iterable[str] = ()) -> Dict[str, float]:
+        """Return ``{skill: score}`` for candidates whose partial ratio reaches ``threshold``.
+
+        Single-term skills are scored against the space-padded tokens that
+        proposed them; multi-term skills against the whole text.
+        """
+        scores: Dict[str, float] = {}
+        for skill, ids, hit in self._candidates(text, exclude):
+            if len(ids) == 1 and " " not in skill:
+                score = max(self._local_score(skill, token, threshold) for token in hit[next(iter(ids))])
+            else:
+                score = fuzz.partial_ratio(skill, text, score_cutoff=threshold)
+            if score >= threshold:
+                scores[skill] = score
+        return scores
+
+    @staticmethod
+    def _local_score(skill: str, token: str, threshold: float) -> float:
+        window = f" {token} "
+        # keep the skill as the needle, as when scoring against the full text
+        if len(window) >= len(skill):
+            return fuzz.partial_ratio(skill, window, score_cutoff=threshold)
+        return fuzz.ratio(skill, window, score_cutoff=threshold)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+from scipy import sparse
+
+
+class TrendMatrix:
+    """Sparse postings x skills incidence matrix with vectorized trend reductions.
+
+    Row ``i`` marks the skills found in posting ``i`` (binary, so every count
+    below is a number of postings). Document frequency is a column sum,
+    co-occurrence is ``X.T @ X`` and per-location counts are ``L @ X`` with
+    ``L`` the one-hot locations x postings matrix.
+    """
+
+    def __init__(self, vocabulary: Sequence[str], matrix: sparse.csr_matrix,
+                 locations: Optional[Sequence[str]] = None) -> None:
+        self.vocabulary = list(vocabulary)
+        self.matrix = matrix
+        self.locations = list(locations) if locations is not None else [""] * matrix.shape[0]
+
+    @classmethod
+    def from_skill_sets(cls, skill_sets: Iterable[Set[str]], vocabulary: Sequence[str],
+                        locations: Optional[Sequence[str]] = None) -> "TrendMatrix":
+        column = {skill: j for j, skill in enumerate(vocabulary)}
+        indptr = [0]
+        indices: List[int] = []
+        for skills in skill_sets:
+            indices.extend(sorted(column[s] for s in skills if s in column))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.int32)
+        matrix = sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(vocabulary)),
+        )
+        return cls(vocabulary, matrix, locations)
+
+    @property
+    def n_postings(self) -> int:
+        return self.matrix.shape[0]
+
+    def document_frequency(self) -> np.ndarray:
+        return np.asarray(self.matrix.sum(axis=0)).ravel()
+
+    def top_skills(self, limit: int = 25) -> List[dict]:
+        """Skills ranked by posting count, ``importance`` relative to the most frequent."""
+        df = self.document_frequency()
+        present = np.flatnonzero(df)
+        if not present.size:
+            return []
+        # stable sort keeps vocabulary order among ties
+        order = present[np.argsort(-df[present], kind="stable")][:limit]
+        top = max(1, int(df[order[0]]))
+        return [
+            {"name": self.vocabulary[j].title(), "importance": round(int(df[j]) / top, 3), "job_count": int(df[j])}
+            for j in order
+        ]
+
+    def cooccurrence(self, skills: Optional[Iterable[str]] = None, limit: int = 5) -> Dict[str, List[dict]]:
+        """For each skill, the skills most often requested in the same postings.
+
+        ``share`` is the fraction of the skill's postings that also ask for the
+        other one.
+        """
+        df = self.document_frequency()
+        if skills is None:
+            rows = np.flatnonzero(df)
+        else:
+            index = {s: j for j, s in enumerate(self.vocabulary)}
+            rows = np.array([index[s] for s in skills if s in index and df[index[s]]], dtype=np.int64)
+        if not rows.size:
+            return {}
+        # only the requested rows of X.T @ X: (X[:, rows]).T @ X
+        pairs = (self.matrix[:, rows].T @ self.matrix).toarray()
+        pairs[np.arange(rows.size), rows] = 0
+        result: Dict[str, List[dict]] = {}
+        for r, j in enumerate(rows):
+            counts = pairs[r]
+            nonzero = np.flatnonzero(counts)
+            if not nonzero.size:
+                continue
+            best = nonzero[np.argsort(-counts[nonzero], kind="stable")][:limit]
+            result[self.vocabulary[j].title()] = [
+                {"name": self.vocabulary[k].title(), "job_count": int(counts[k]),
+                 "share": round(int(counts[k]) / int(df[j]), 3)}
+                for k in best
+            ]
+        return result
+
+    def by_location(self, limit: int = 5, max_locations: int = 10) -> Dict[str, List[str]]:
+        """Most requested skills per posting location, busiest locations first."""
+        names, codes = np.unique(np.asarray(self.locations, dtype=object), return_inverse=True)
+        keep = np.array([bool(n) for n in names])
+        if not keep.any():
+            return {}
+        onehot = sparse.csr_matrix(
+            (np.ones(self.n_postings, dtype=np.int32), (codes, np.arange(self.n_postings))),
+            shape=(len(names), self.n_postings),
+        )
+        counts = (onehot @ self.matrix).toarray()
+        postings = np.bincount(codes, minlength=len(names))
+        result: Dict[str, List[str]] = {}
+        for loc in np.argsort(-postings, kind="stable"):
+            if not keep[loc]:
+                continue
+            row = counts[loc]
+            nonzero = np.flatnonzero(row)
+            if nonzero.size:
+                best = nonzero[np.argsort(-row[nonzero], kind="stable")][:limit]
+                result[str(names[loc])] = [self.vocabulary[k].title() for k in best]
+            if len(result) >= max_locations:
+                break
+        return result
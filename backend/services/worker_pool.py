@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import multiprocessing
+import threading
+
+from backend.utils.settings import settings
+
+
+class PoolSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class BoundedProcessPool:
+    """Process pool for CPU-bound work with a hard cap on queued jobs.
+
+    At most ``max_workers`` jobs run at once and ``max_queue`` more may wait;
+    beyond that :meth:`run` fails fast with :class:`PoolSaturated` instead of
+    letting requests pile up behind a long queue.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: never fork a process that already runs server threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._inflight >= self.capacity:
+                raise PoolSaturated(f"{self._inflight} jobs in flight (capacity {self.capacity})")
+            self._inflight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._inflight -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in a worker process without blocking the event loop.
+
+        The slot is held until the job itself finishes: cancelling the caller
+        cancels a job that is still queued, but one already running keeps its
+        slot until the worker is done with it.
+        """
+        self._acquire()
+        try:
+            with self._lock:
+                executor = self._get_executor()
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # a worker died (e.g. OOM on a hostile PDF); start fresh next time
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+resume_pool = BoundedProcessPool(settings.RESUME_WORKERS, settings.RESUME_QUEUE_DEPTH)
@@ -6,13 +6,68 @@ class Settings(BaseSettings):
 
     MONGODB_URI: str = ''
     RAPIDAPI_KEY: str = ''
+    # point at benchmarks/jsearch_standin.py for load tests
+    RAPIDAPI_URL: str = 'https://jsearch.p.rapidapi.com/search'
     GEMINI_API_KEY: str = ''
     ALLOWED_ORIGINS: str = 'http://localhost:5173,http://127.0.0.1:5173,http://localhost:5174,http://127.0.0.1:5174,http://localhost:5175,http://127.0.0.1:5175,https://*.netlify.app'
     JWT_SECRET: str = 'change-me'
     JWT_EXPIRE_MINUTES: int = 60 * 24
+    # Resume skill extraction
+    SKILL_FUZZY_THRESHOLD: int = 75
+    RESUME_BATCH_MAX_ITEMS: int = 1000
+    RESUME_BATCH_CHUNK_SIZE: int = 16
+    ANALYSIS_CACHE_SIZE: int = 2048
+    # Near-duplicate resume reuse (MinHash/LSH, per user)
+    RESUME_DEDUP_THRESHOLD: float = 0.8
+    RESUME_DEDUP_PER_USER: int = 10
+    RESUME_DEDUP_MAX_USERS: int = 5000
+    # Optional spaCy lemmatization (used only when spaCy and the model are installed)
+    SPACY_MODEL: str = 'en_core_web_sm'
+    SPACY_BATCH_SIZE: int = 64
+    SPACY_N_PROCESS: int = 1
+    # PDF parsing / analysis worker processes for /upload_resume
+    RESUME_WORKERS: int = 2
+    RESUME_QUEUE_DEPTH: int = 8
+    RESUME_RETRY_AFTER_SECONDS: int = 5
+    PDF_MAX_BYTES: int = 5 * 1024 * 1024
+    PDF_MAX_PAGES: int = 30
+    PDF_PAGES_PER_TASK: int = 2
+    PDF_TEXT_TARGET_CHARS: int = 20000
+    # JSearch HTTP client (pooled, pages fetched concurrently)
+    JSEARCH_TIMEOUT_SECONDS: float = 8.0
+    JSEARCH_MAX_CONNECTIONS: int = 20
+    JSEARCH_MAX_CONCURRENCY: int = 5
+    # RapidAPI quota (0 = unlimited) and circuit breaker for JSearch
+    JSEARCH_QUOTA_PER_MINUTE: int = 0
+    JSEARCH_QUOTA_PER_DAY: int = 0
+    JSEARCH_BREAKER_FAILURES: int = 5
+    JSEARCH_BREAKER_RESET_SECONDS: float = 30.0
+    # JSearch page cache (served stale while refreshing in the background)
+    MARKET_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+    MARKET_CACHE_STALE_SECONDS: int = 24 * 60 * 60
+    MARKET_CACHE_MAX_ENTRIES: int = 1024
+    # JSearch pages behind one market snapshot (trending skills + statistics)
+    MARKET_SNAPSHOT_PAGES: int = 2
+    MARKET_BATCH_MAX_QUERIES: int = 25
+    # Background precompute of catalog roles (requires RAPIDAPI_KEY)
+    MARKET_PRECOMPUTE_ENABLED: bool = True
+    MARKET_PRECOMPUTE_LOCATIONS: str = ''  # ';'-separated, e.g. 'New York, NY;Austin, TX'
+    MARKET_PRECOMPUTE_INTERVAL_SECONDS: int = 6 * 60 * 60
+    MARKET_PRECOMPUTE_STAGGER_SECONDS: float = 5.0
+    # Accumulated job-posting corpus (job_postings collection)
+    MARKET_CORPUS_WINDOW_DAYS: int = 30
+    MARKET_CORPUS_MAX_POSTINGS: int = 2000
+    MARKET_CORPUS_DELTA_DATE_POSTED: str = '3days'
+    # Incremental skill-demand rollups (skill_rollups_daily / skill_demand)
+    MARKET_DEMAND_HALF_LIFE_DAYS: float = 14.0
+    MARKET_GROWTH_WINDOW_DAYS: int = 30
 
     @property
     def allowed_origins_list(self) -> List[str]:
         return [s.strip() for s in self.ALLOWED_ORIGINS.split(',') if s.strip()]
 
+    @property
+    def market_precompute_locations_list(self) -> List[str]:
+        return [s.strip() for s in self.MARKET_PRECOMPUTE_LOCATIONS.split(';') if s.strip()]
+
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Benchmark market trend computation against the local JSearch stand-in.
+
+Usage (from the repository root):
+    python benchmarks/bench_market_trends.py [--latency-ms 300] [--sizes 100,1000,5000]
+
+1. Snapshot throughput: trends + statistics built from synthetic corpora of
+   each --sizes postings (no HTTP), reported as postings per second.
+2. End-to-end /api/market_trends for a few roles with the stand-in serving
+   on localhost with --latency-ms per request: first (cold) call and a
+   repeated (cached) call. No RapidAPI quota is used.
+"""
+from __future__ import annotations
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import uvicorn  # noqa: E402
+
+from backend.utils.settings import settings  # noqa: E402
+from benchmarks.jsearch_fixtures import generate_postings  # noqa: E402
+from benchmarks.jsearch_standin import create_app  # noqa: E402
+
+ROLES = ["Frontend Developer", "Data Scientist", "Registered Nurse", "Civil Engineer"]
+
+
+def _serve(port: int, latency_ms: float) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(create_app(latency_ms=latency_ms), port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def bench_snapshot(sizes) -> None:
+    from backend.services.market_trend_service import market_snapshot_from_items
+
+    print(f"{'postings':>9} {'seconds':>8} {'postings/s':>11} {'top skill':>20}")
+    for size in sizes:
+        items = generate_postings(size, ROLES[:1], seed=size)
+        start = time.perf_counter()
+        snapshot = market_snapshot_from_items(ROLES[0], items)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>9} {elapsed:>8.3f} {size / elapsed:>11.0f} {snapshot['trending_skills'][0]['name']:>20}")
+
+
+def bench_endpoint() -> None:
+    from fastapi.testclient import TestClient
+    from backend.main import app
+
+    print(f"\n{'role':>20} {'cold ms':>8} {'cached ms':>10} {'skills':>7}")
+    with TestClient(app) as client:
+        for role in ROLES:
+            timings = []
+            for _ in range(2):
+                start = time.perf_counter()
+                resp = client.get("/api/market_trends", params={"role": role, "location": ""})
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{role:>20} {timings[0]:>8.0f} {timings[1]:>10.1f} {len(resp.json()['trending_skills']):>7}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--port", type=int, default=8977)
+    parser.add_argument("--sizes", default="100,1000,5000")
+    args = parser.parse_args()
+
+    bench_snapshot([int(s) for s in args.sizes.split(",")])
+
+    _serve(args.port, args.latency_ms)
+    settings.RAPIDAPI_KEY = settings.RAPIDAPI_KEY or "standin"
+    settings.MARKET_PRECOMPUTE_ENABLED = False
+    settings.MONGODB_URI = ""
+    from backend.services.jsearch_client import jsearch_client
+    # the shared client already exists; point it at the stand-in
+    jsearch_client.url = f"http://127.0.0.1:{args.port}/search"
+    bench_endpoint()
+
+
+if __name__ == "__main__":
+    main()
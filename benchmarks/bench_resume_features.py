@@ -0,0 +1,87 @@
+"""
+Per-resume benchmark of the single-pass ResumeFeatureExtractor against the
+original three-function pipeline (extract_skills with a substring/token pass
+plus brute-force fuzzy pass, guess_current_role, extract_experience_years).
+
+Usage (from the repository root):
+    python benchmarks/bench_resume_features.py [--repeat 5]
+
+Role and experience must agree with the original pipeline; skills differ by
+design (see bench_skill_fuzzy.py), so only their counts are shown.
+"""
+from __future__ import annotations
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rapidfuzz import fuzz  # noqa: E402
+
+from backend.services.resume_parser import (  # noqa: E402
+    ROLE_KEYWORDS, _EXPERIENCE_PATTERNS, _EXTRACTOR, _SKILLS_DB, normalize,
+)
+from tests.resume_fixtures import make_resume  # noqa: E402
+
+
+def original_pipeline(resume_text: str) -> dict:
+    text = normalize(resume_text)
+    found = set()
+    tokens = set(re.split(r"[^a-z0-9+.#]+", text))
+    for skill in _SKILLS_DB:
+        if (" " in skill and skill in text) or (" " not in skill and skill in tokens):
+            found.add(skill)
+    for skill in _SKILLS_DB:
+        if skill not in found and fuzz.partial_ratio(skill, text) >= 75:
+            found.add(skill)
+
+    lowered = resume_text.lower()
+    scores = {}
+    for role, keywords in ROLE_KEYWORDS.items():
+        score = sum(1 for kw in keywords if kw in lowered)
+        if score > 0:
+            scores[role] = score
+    role = max(scores, key=scores.get) if scores else None
+
+    years = None
+    for pattern in _EXPERIENCE_PATTERNS:
+        m = re.search(pattern, lowered)
+        if m and 0 < int(m.group(1)) <= 70:
+            years = int(m.group(1))
+            break
+    return {"skills": found, "current_role": role, "experience_years": years}
+
+
+def _timed(fn, text: str, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'chars':>7} {'original ms':>12} {'single-pass ms':>15} {'speedup':>8} {'role/exp agree':>15} {'skills orig/new':>16}")
+    for size in (1_000, 3_000, 10_000, 50_000):
+        text, _ = make_resume(size, rng)
+        text = f"Senior engineer with {rng.randint(1, 20)} years of experience.\n{text}"
+        t_old, old = _timed(original_pipeline, text, args.repeat)
+        t_new, new = _timed(_EXTRACTOR.extract, text, args.repeat)
+        agree = old["current_role"] == new["current_role"] and old["experience_years"] == new["experience_years"]
+        print(f"{len(text):>7} {t_old * 1000:>12.1f} {t_new * 1000:>15.1f} {t_old / max(t_new, 1e-9):>7.1f}x "
+              f"{str(agree):>15} {len(old['skills']):>8} / {len(new['skills']):<6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark the trigram-candidate fuzzy pass of extract_skills against the
+previous brute-force pass (fuzz.partial_ratio of every skill vs. the whole text).
+
+Usage (from the repository root):
+    python benchmarks/bench_skill_fuzzy.py [--threshold 75] [--repeat 3]
+
+The synthetic resumes plant catalog skills (some with a one-character typo)
+among filler prose. "recall" is measured against the brute-force result;
+"planted" is the share of planted skills each pass recovers and "spurious" the
+number of accepted skills that were never planted (e.g. "rust" ~ "uest").
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rapidfuzz import fuzz  # noqa: E402
+
+from backend.services.resume_parser import _EXTRACTOR, _SKILLS_DB, _SKILL_TRIGRAMS, normalize  # noqa: E402
+from tests.resume_fixtures import make_resume  # noqa: E402
+
+
+def brute_force(text: str, exact: set, threshold: float) -> set:
+    return {s for s in _SKILLS_DB if s not in exact and fuzz.partial_ratio(s, text) >= threshold}
+
+
+def indexed(text: str, exact: set, threshold: float) -> set:
+    return set(_SKILL_TRIGRAMS.match(text, threshold=threshold, exclude=exact))
+
+
+def _timed(fn, *args, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=float, default=75)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'chars':>7} {'brute ms':>9} {'index ms':>9} {'speedup':>8} {'recall':>7} "
+          f"{'planted brute/index':>20} {'spurious brute/index':>21}")
+    for size in (1_000, 10_000, 50_000):
+        raw, planted = make_resume(size, rng)
+        text = normalize(raw)
+        exact, _ = _EXTRACTOR.scan(text)
+        t_old, old = _timed(brute_force, text, exact, args.threshold, repeat=args.repeat)
+        t_new, new = _timed(indexed, text, exact, args.threshold, repeat=args.repeat)
+        recall = len(old & new) / len(old) if old else 1.0
+        missing = planted - exact
+        found_old = len(old & missing) / len(missing) if missing else 1.0
+        found_new = len(new & missing) / len(missing) if missing else 1.0
+        print(f"{len(text):>7} {t_old * 1000:>9.1f} {t_new * 1000:>9.1f} {t_old / max(t_new, 1e-9):>7.1f}x "
+              f"{recall:>7.0%} {found_old:>10.0%} / {found_new:<7.0%} {len(old - planted):>11} / {len(new - planted):<7}")
+
+
+if __name__ == "__main__":
+    main()
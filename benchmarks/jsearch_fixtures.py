@@ -0,0 +1,112 @@
+"""
+Generate synthetic JSearch postings (the items of a /search response's data[]).
+
+Usage (from the repository root):
+    python benchmarks/jsearch_fixtures.py --postings 5000 --out jsearch_fixtures.json
+    python benchmarks/jsearch_fixtures.py --postings 200 --role "Data Scientist" --days 90
+
+Each posting is built for a catalog role (roles_skills.json): its description
+mixes most of the role's required skills, a few random catalog skills and
+filler prose, with employer, city, remote flag, salary range and a posting
+time spread over the last --days days. Output is a JSON list that
+benchmarks/jsearch_standin.py serves via JSEARCH_STANDIN_FIXTURES; the same
+seed always yields the same corpus.
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services.market_trend_service import SKILLS_DB  # noqa: E402
+from backend.services.career_catalog import get_catalog  # noqa: E402
+
+EMPLOYERS = [
+    "Acme Corp", "Globex", "Initech", "Umbrella Health", "Stark Industries", "Wayne Enterprises",
+    "Hooli", "Vandelay Industries", "Cyberdyne", "Soylent Foods", "Wonka Labs", "Tyrell Systems",
+]
+CITIES = [
+    ("San Francisco", "CA"), ("Seattle", "WA"), ("New York", "NY"), ("Austin", "TX"),
+    ("Boston", "MA"), ("Chicago", "IL"), ("Denver", "CO"), ("Atlanta", "GA"),
+]
+FILLER = (
+    "we are looking for a motivated professional to join our growing team you will collaborate "
+    "with cross functional partners own deliverables end to end and help shape our roadmap "
+    "competitive salary flexible hours health benefits and a supportive culture"
+).split()
+
+
+def _description(rng: random.Random, skills: Sequence[str], extra: Sequence[str]) -> str:
+    words = rng.sample(FILLER, k=min(len(FILLER), 25))
+    for skill in list(skills) + list(extra):
+        words.insert(rng.randrange(len(words) + 1), skill)
+    return " ".join(words)
+
+
+def make_posting(rng: random.Random, job_id: str, role: str, required: Sequence[str],
+                 now: float, days: int) -> dict:
+    city, state = rng.choice(CITIES)
+    skills = rng.sample(list(required), k=max(1, int(len(required) * rng.uniform(0.5, 0.9)))) if required else []
+    extra = rng.sample(SKILLS_DB, k=3)
+    low = rng.randrange(60, 160) * 1000
+    return {
+        "job_id": job_id,
+        "job_title": f"{rng.choice(['', 'Senior ', 'Junior ', 'Lead '])}{role}".strip(),
+        "employer_name": rng.choice(EMPLOYERS),
+        "job_description": _description(rng, skills, extra),
+        "job_city": city,
+        "job_state": state,
+        "job_country": "US",
+        "job_is_remote": rng.random() < 0.4,
+        "job_min_salary": low if rng.random() < 0.7 else None,
+        "job_max_salary": low + rng.randrange(10, 60) * 1000,
+        "job_salary_period": "YEAR",
+        "job_highlights": {
+            "Qualifications": [f"Experience with {s}" for s in skills[:3]],
+            "Responsibilities": ["Deliver high quality work", "Collaborate with the team"],
+        },
+        "job_posted_at_timestamp": int(now - rng.random() * days * 86400),
+    }
+
+
+def generate_postings(count: int, roles: Optional[Sequence[str]] = None, days: int = 60,
+                      seed: int = 0) -> List[dict]:
+    """``count`` postings spread round-robin over ``roles`` (default: the whole catalog)."""
+    rng = random.Random(seed)
+    catalog = get_catalog().required_skills_by_role
+    required = {role.lower(): skills for role, skills in catalog.items()}
+    names = list(roles) if roles else list(catalog)
+    now = time.time()
+    return [
+        # the seed is part of the id so corpora generated per role never collide
+        make_posting(rng, f"synthetic-{seed & 0xffffffff:08x}-{i:07d}", names[i % len(names)],
+                     required.get(names[i % len(names)].lower(), []), now, days)
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--postings", type=int, default=1000)
+    parser.add_argument("--role", action="append", help="catalog role to generate for (repeatable; default all)")
+    parser.add_argument("--days", type=int, default=60, help="spread of posting times")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="-", help="output file (default stdout)")
+    args = parser.parse_args()
+
+    postings = generate_postings(args.postings, args.role, args.days, args.seed)
+    payload = json.dumps(postings)
+    if args.out == "-":
+        print(payload)
+    else:
+        Path(args.out).write_text(payload, encoding="utf-8")
+        print(f"wrote {len(postings)} postings to {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Local JSearch-compatible stand-in for load tests and benchmarks.
+
+Usage (from the repository root):
+    JSEARCH_STANDIN_LATENCY_MS=300 uvicorn benchmarks.jsearch_standin:app --port 8900
+    RAPIDAPI_URL=http://127.0.0.1:8900/search RAPIDAPI_KEY=dummy uvicorn backend.main:app
+
+GET /search answers like jsearch.p.rapidapi.com/search: ``query`` is
+"<role> in <location>" (or just "<role>"), ``page``/``num_pages`` page through
+10 postings per page and ``date_posted`` (today, 3days, week, month) filters
+by posting time. Postings come from JSEARCH_STANDIN_FIXTURES (a JSON list as
+written by benchmarks/jsearch_fixtures.py, or recorded {"data": [...]}
+responses) or are synthesized per role. GET /stats reports served requests.
+
+Environment:
+    JSEARCH_STANDIN_FIXTURES     fixture file (default: synthesize)
+    JSEARCH_STANDIN_PER_QUERY    synthetic postings per role (default 200)
+    JSEARCH_STANDIN_LATENCY_MS   added latency per request (default 0)
+    JSEARCH_STANDIN_JITTER_MS    uniform extra latency (default 0)
+    JSEARCH_STANDIN_ERROR_RATE   share of requests answered 500 (default 0)
+    JSEARCH_STANDIN_429_RATE     share of requests answered 429 (default 0)
+    JSEARCH_STANDIN_SEED         random seed (default 0)
+"""
+from __future__ import annotations
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi import FastAPI, Query  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from benchmarks.jsearch_fixtures import generate_postings  # noqa: E402
+
+PAGE_SIZE = 10
+DATE_POSTED_DAYS = {"today": 1, "3days": 3, "week": 7, "month": 30}
+
+
+def load_fixtures(path: str) -> List[dict]:
+    """Postings from a generated list or from recorded JSearch responses."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(raw, dict):
+        raw = [raw]
+    postings: List[dict] = []
+    for entry in raw:
+        if isinstance(entry, dict) and isinstance(entry.get("data"), list):
+            postings.extend(entry["data"])
+        else:
+            postings.append(entry)
+    return postings
+
+
+def _split_query(query: str) -> tuple:
+    role, sep, location = query.lower().rpartition(" in ")
+    return (role, location) if sep else (query.lower(), "")
+
+
+def create_app(postings: Optional[List[dict]] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+               error_rate: float = 0.0, throttle_rate: float = 0.0, per_query: int = 200,
+               seed: int = 0) -> FastAPI:
+    app = FastAPI(title="JSearch stand-in")
+    rng = random.Random(seed)
+    synthetic: Dict[str, List[dict]] = {}
+    served: Counter = Counter()
+
+    def corpus_for(role: str) -> List[dict]:
+        if postings is not None:
+            words = role.split()
+            return [p for p in postings if all(w in (p.get("job_title") or "").lower() for w in words)]
+        if role not in synthetic:
+            # stable per role, so repeated runs see the same corpus
+            synthetic[role] = generate_postings(per_query, [role.title()], seed=seed ^ zlib.crc32(role.encode()))
+        return synthetic[role]
+
+    @app.get("/search")
+    async def search(query: str = Query(...), page: int = Query(1, ge=1), num_pages: int = Query(1, ge=1),
+                     date_posted: str = Query("all")):
+        delay = latency_ms + (rng.random() * jitter_ms if jitter_ms else 0.0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        roll = rng.random()
+        if roll < throttle_rate:
+            served["429"] += 1
+            return JSONResponse({"message": "Too many requests"}, status_code=429, headers={"Retry-After": "1"})
+        if roll < throttle_rate + error_rate:
+            served["500"] += 1
+            return JSONResponse({"message": "Internal error"}, status_code=500)
+
+        role, location = _split_query(query)
+        matches = corpus_for(role)
+        if location:
+            matches = [p for p in matches
+                       if location in f"{p.get('job_city', '')}, {p.get('job_state', '')}".lower()
+                       or location in (p.get("job_country") or "").lower()]
+        days = DATE_POSTED_DAYS.get(date_posted)
+        if days:
+            cutoff = time.time() - days * 86400
+            matches = [p for p in matches if (p.get("job_posted_at_timestamp") or 0) >= cutoff]
+        start = (page - 1) * PAGE_SIZE
+        data = matches[start:start + PAGE_SIZE * num_pages]
+        served["200"] += 1
+        return {
+            "status": "OK",
+            "request_id": f"standin-{sum(served.values())}",
+            "parameters": {"query": query, "page": page, "num_pages": num_pages, "date_posted": date_posted},
+            "data": data,
+        }
+
+    @app.get("/stats")
+    async def stats():
+        return dict(served)
+
+    return app
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.environ.get(name, default))
+
+
+app = create_app(
+    postings=load_fixtures(os.environ["JSEARCH_STANDIN_FIXTURES"]) if os.environ.get("JSEARCH_STANDIN_FIXTURES") else None,
+    latency_ms=_env_float("JSEARCH_STANDIN_LATENCY_MS", 0),
+    jitter_ms=_env_float("JSEARCH_STANDIN_JITTER_MS", 0),
+    error_rate=_env_float("JSEARCH_STANDIN_ERROR_RATE", 0),
+    throttle_rate=_env_float("JSEARCH_STANDIN_429_RATE", 0),
+    per_query=int(_env_float("JSEARCH_STANDIN_PER_QUERY", 200)),
+    seed=int(_env_float("JSEARCH_STANDIN_SEED", 0)),
+)
@@ -0,0 +1,37 @@
+"""Synthetic resumes shared by the tests and the resume benchmarks."""
+from __future__ import annotations
+import random
+
+from backend.services.resume_parser import _SKILLS_DB
+
+FILLER = (
+    "responsible for delivering features across the team worked closely with product "
+    "and design stakeholders improved reliability reduced costs mentored junior engineers "
+    "led migration planning wrote documentation participated in code reviews on call rotation "
+    "phone address references available upon request bachelor degree university"
+).split()
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    if len(word) < 5:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:] if rng.random() < 0.5 else word[:i] + rng.choice("aeiou") + word[i + 1:]
+
+
+def make_resume(size: int, rng: random.Random) -> tuple[str, set]:
+    skills = sorted(_SKILLS_DB)
+    planted = set()
+    words = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.08:
+            skill = rng.choice(skills)
+            word = _typo(skill, rng) if rng.random() < 0.3 else skill
+            planted.add(skill)
+        else:
+            word = rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    text = " ".join(words)
+    return text[:text.rfind(" ", 0, size)], planted
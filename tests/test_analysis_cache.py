@@ -0,0 +1,12 @@
+from backend.services.analysis_cache import content_hash
+from backend.utils.settings import settings
+
+
+def test_content_hash_ignores_case_and_spacing():
+    assert content_hash("Python  Developer\n") == content_hash("python developer")
+
+
+def test_content_hash_changes_with_fuzzy_threshold(monkeypatch):
+    before = content_hash("python developer")
+    monkeypatch.setattr(settings, "SKILL_FUZZY_THRESHOLD", settings.SKILL_FUZZY_THRESHOLD + 5)
+    assert content_hash("python developer") != before
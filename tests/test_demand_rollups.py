@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.services.demand_rollups import DemandRollups, encode_key
+
+NOW = datetime(2026, 6, 1)
+
+
+def test_half_life_must_be_positive():
+    with pytest.raises(ValueError):
+        DemandRollups(half_life_days=0)
+
+
+@pytest.mark.parametrize("half_life", [0.25, 1, 14])
+def test_weights_stay_bounded_far_from_epoch(half_life):
+    rollups = DemandRollups(half_life_days=half_life)
+    for when in (NOW, datetime(2100, 1, 1), datetime(2300, 7, 15)):
+        weight = rollups._weight(when, rollups._era(when))
+        assert 1.0 <= weight < 2.0 ** DemandRollups.ERA_HALF_LIVES
+
+
+def test_decayed_scores_favour_recent_postings_across_eras():
+    rollups = DemandRollups(half_life_days=1)
+    old, new = NOW - timedelta(days=3), NOW
+    decayed = {}
+    for when, skill in ((old, "java"), (old, "java"), (new, "go")):
+        era = rollups._era(when)
+        era_scores = decayed.setdefault(str(era), {})
+        era_scores[encode_key(skill)] = era_scores.get(encode_key(skill), 0.0) + rollups._weight(when, era)
+    scores = rollups._decayed_scores({"decayed": decayed}, NOW)
+    assert scores["go"] == pytest.approx(1.0)
+    assert scores["java"] == pytest.approx(2 * 2.0 ** -3)
+
+
+def test_growth_needs_both_windows_ingested():
+    rollups = DemandRollups(growth_window_days=30)
+    by_day = {(NOW - timedelta(days=d)).strftime("%Y-%m-%d"): 1 for d in range(1, 60)}
+    by_day[(NOW - timedelta(days=2)).strftime("%Y-%m-%d")] += 29
+    assert rollups._growth_rate({"first_ingested_at": NOW - timedelta(days=10)}, by_day, NOW) is None
+    growth = rollups._growth_rate({"first_ingested_at": NOW - timedelta(days=61)}, by_day, NOW)
+    assert growth == pytest.approx((58 - 30) / 30 * 100, abs=0.1)
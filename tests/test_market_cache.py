@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from backend.services.market_cache import SingleFlight, StaleWhileRevalidateCache
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"inflight": 0, "calls": 1, "shared": 4}
+
+
+def test_error_reaches_every_waiter_and_clears_key():
+    flight = SingleFlight()
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def ok():
+        return "fresh"
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.do("key", failing) for _ in range(3)), return_exceptions=True)
+        assert flight.stats()["inflight"] == 0
+        # the failure is not cached: the next call runs again
+        return results, await flight.do("key", ok)
+
+    results, retried = asyncio.run(scenario())
+    assert len(attempts) == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "upstream down" for r in results)
+    assert retried == "fresh"
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        first = asyncio.create_task(flight.do("key", load))
+        second = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "done"
+
+
+class _Loader:
+    """Coroutine factory returning queued values (exceptions are raised)."""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def test_fresh_entry_is_served_without_loading():
+    cache = StaleWhileRevalidateCache(ttl=60, stale_ttl=60)
+    loader = _Loader({"v": 1})
+
+    async def scenario():
+        first = await cache.get_or_load("k", loader)
+        first["v"] = 99  # callers get copies
+        return await cache.get_or_load("k", loader)
+
+    assert asyncio.run(scenario()) == {"v": 1}
+    assert loader.calls == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_stale_entry_is_served_while_one_refresh_runs():
+    cache = StaleWhileRevalidateCache(ttl=0, stale_ttl=60)
+    loader = _Loader("old", "new")
+
+    async def scenario():
+        await cache.get_or_load("k", loader)
+        stale = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(3)))
+        await asyncio.gather(*cache._tasks)
+        return stale, cache._lookup("k")[0]
+
+    stale, refreshed = asyncio.run(scenario())
+    assert stale == ["old"] * 3
+    assert refreshed == "new"
+    assert loader.calls == 2
+    assert cache.stats()["stale_hits"] == 3 and cache.stats()["refreshing"] == 0
+
+
+def test_failed_refresh_keeps_stale_value():
+    cache = StaleWhileRevalidateCache(ttl=0, stale_ttl=60)
+    loader = _Loader("old", RuntimeError("upstream down"), None)
+
+    async def scenario():
+        await cache.get_or_load("k", loader)
+        await cache.get_or_load("k", loader)
+        await asyncio.gather(*cache._tasks)
+        return await cache.get_or_load("k", loader, refresh=True)
+
+    assert asyncio.run(scenario()) == "old"
+    assert cache._lookup("k")[0] == "old"
+
+
+def test_expired_entry_beats_failed_inline_load():
+    cache = StaleWhileRevalidateCache(ttl=0, stale_ttl=0)
+    loader = _Loader("old", None)
+
+    async def scenario():
+        await cache.get_or_load("k", loader)
+        return await cache.get_or_load("k", loader), await cache.get_or_load("missing", _Loader(None))
+
+    assert asyncio.run(scenario()) == ("old", None)
+    assert cache.stats()["size"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = StaleWhileRevalidateCache(ttl=60, stale_ttl=60, maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache._lookup("a")[0] == 1
+    cache.put("c", 3)
+    assert cache._lookup("b") == (None, None)
+    assert cache._lookup("a")[0] == 1 and cache._lookup("c")[0] == 3
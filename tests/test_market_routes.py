@@ -0,0 +1,44 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.routes import router
+from backend.utils.settings import settings
+
+
+def _client(monkeypatch):
+    # no provider and no database: snapshots come from the role-based fallback
+    monkeypatch.setattr(settings, "RAPIDAPI_KEY", "")
+    monkeypatch.setattr(settings, "MONGODB_URI", "")
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return TestClient(app)
+
+
+def test_batch_reports_same_canonical_query_as_single(monkeypatch):
+    client = _client(monkeypatch)
+    queries = [("Java Developer", "Portland ,OR"), ("Sr. Front-End Dev", "nyc")]
+    batch = client.post("/api/market_trends/batch", json={
+        "queries": [{"role": r, "location": l} for r, l in queries],
+    }).json()["results"]
+    for role, location in queries:
+        single = client.get("/api/market_trends", params={"role": role, "location": location}).json()
+        assert batch[role]["canonical_role"] == single["canonical_role"]
+        assert batch[role]["canonical_location"] == single["canonical_location"]
+    assert batch["Java Developer"]["canonical_location"] == "Portland, OR"
+    assert batch["Sr. Front-End Dev"]["canonical_role"] == "Frontend Developer"
+
+
+def test_batch_computes_duplicate_queries_once(monkeypatch):
+    client = _client(monkeypatch)
+    batch = client.post("/api/market_trends/batch", json={
+        "queries": [{"role": "Frontend Developer", "location": "NYC"},
+                    {"role": "front-end dev", "location": "New York, NY"}],
+    }).json()["results"]
+    assert list(batch) == ["Frontend Developer"]
+
+
+def test_cache_stats_require_authentication(monkeypatch):
+    client = _client(monkeypatch)
+    for path in ("/api/analyses/cache_stats", "/api/market_trends/cache_stats"):
+        assert client.get(path).status_code == 401
+        assert client.get(path, headers={"Authorization": "Bearer not-a-token"}).status_code == 401
@@ -0,0 +1,61 @@
+import asyncio
+
+from backend.services.pdf_ingestion import ingest_pdf
+from backend.utils.settings import settings
+
+
+class _FakePool:
+    """Answers page-range jobs after a short delay and records concurrency."""
+
+    def __init__(self, max_workers, pages):
+        self.max_workers = max_workers
+        self.pages = pages
+        self.running = 0
+        self.peak = 0
+        self.calls = []
+        self.inflight = 0
+
+    async def run(self, fn, path, start, stop):
+        self.calls.append(start)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+        return "".join(f"page {p}\n" for p in range(start, min(stop, self.pages))), self.pages
+
+
+def _ingest_all(monkeypatch, pool):
+    monkeypatch.setattr(settings, "PDF_PAGES_PER_TASK", 1)
+    monkeypatch.setattr(settings, "PDF_TEXT_TARGET_CHARS", 10 ** 6)
+    text = asyncio.run(ingest_pdf("resume.pdf", pool))
+    assert text == "".join(f"page {p}\n" for p in range(pool.pages))
+
+
+def test_default_pool_extracts_page_ranges_in_parallel(monkeypatch):
+    pool = _FakePool(max_workers=settings.RESUME_WORKERS, pages=10)
+    _ingest_all(monkeypatch, pool)
+    assert pool.peak == 2
+
+
+def test_fanout_is_capped_at_half_the_pool(monkeypatch):
+    pool = _FakePool(max_workers=8, pages=20)
+    _ingest_all(monkeypatch, pool)
+    assert pool.peak == 4
+
+
+def test_busy_pool_still_fans_out_to_two(monkeypatch):
+    pool = _FakePool(max_workers=8, pages=20)
+    pool.inflight = 7
+    _ingest_all(monkeypatch, pool)
+    assert pool.peak == 2
+
+
+def test_early_stop_keeps_leading_pages(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_PAGES_PER_TASK", 1)
+    monkeypatch.setattr(settings, "PDF_TEXT_TARGET_CHARS", 20)
+    pool = _FakePool(max_workers=2, pages=20)
+    text = asyncio.run(ingest_pdf("resume.pdf", pool))
+    assert text == "page 0\npage 1\npage 2\n"
+    assert len(pool.calls) < 20
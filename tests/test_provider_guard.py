@@ -0,0 +1,104 @@
+from backend.services.provider_guard import CircuitBreaker, QuotaBudget
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["short_circuited"] == 1
+
+
+def test_breaker_admits_one_half_open_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 29.9
+    assert not breaker.allow()
+    clock.now = 30
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_failed_probe_reopens_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30, clock=clock)
+    breaker.trip()
+    clock.now = 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 59
+    assert not breaker.allow()
+    clock.now = 60
+    assert breaker.allow()
+
+
+def test_released_probe_can_be_retried():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_retry_after_trips_immediately_and_extends_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30, clock=clock)
+    breaker.record_failure(retry_after=120)
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 119
+    assert not breaker.allow()
+    clock.now = 120
+    assert breaker.allow()
+
+
+def test_quota_refuses_within_minute_then_resets():
+    clock = FakeClock(60 * 1000)
+    budget = QuotaBudget(per_minute=2, clock=clock)
+    assert budget.try_acquire() and budget.try_acquire()
+    assert not budget.try_acquire()
+    assert budget.stats()["rejected"] == 1
+    clock.now += 59
+    assert not budget.try_acquire()
+    clock.now += 1
+    assert budget.try_acquire()
+    assert budget.stats()["minute_used"] == 1
+
+
+def test_quota_daily_limit_spans_minutes():
+    clock = FakeClock(86400 * 10)
+    budget = QuotaBudget(per_minute=0, per_day=3, clock=clock)
+    for _ in range(3):
+        assert budget.try_acquire()
+        clock.now += 60
+    assert not budget.try_acquire()
+    clock.now = 86400 * 11
+    assert budget.try_acquire()
+    assert budget.stats()["day_used"] == 1
+
+
+def test_zero_limits_disable_quota():
+    budget = QuotaBudget(clock=FakeClock())
+    assert all(budget.try_acquire() for _ in range(100))
+    assert budget.stats()["rejected"] == 0
@@ -0,0 +1,43 @@
+import pytest
+
+from backend.services.market_cache import canonical_query
+from backend.services.query_normalizer import normalize_location, normalize_role
+
+
+@pytest.mark.parametrize("raw, role", [
+    ("Frontend Developer", "Frontend Developer"),
+    ("front-end developer", "Frontend Developer"),
+    ("Sr. Front End Dev", "Frontend Developer"),
+    ("Backend Developers", "Backend Developer"),
+    ("machine learning engineers", "ML Engineer"),
+    ("Fronted Developer", "Frontend Developer"),
+    ("ui ux designers", "UI/UX Designer"),
+])
+def test_spelling_variants_map_to_catalog_role(raw, role):
+    assert normalize_role(raw) == role
+
+
+@pytest.mark.parametrize("raw", [
+    "Product Designer", "UX Designer", "Cloud Engineer", "Solutions Architect",
+    "Web Developer", "AI Engineer", "Site Reliability Engineer", "iOS Developer",
+])
+def test_distinct_titles_are_left_alone(raw):
+    assert normalize_role(raw) == raw
+
+
+def test_unknown_role_keeps_collapsed_input():
+    assert normalize_role("  Data   Engineer ") == "Data Engineer"
+
+
+@pytest.mark.parametrize("raw", ["LA", "la", "L.A.", "LA, CA", "los angeles ca", "Los Angeles, CA"])
+def test_location_aliases_with_and_without_state(raw):
+    assert normalize_location(raw) == "Los Angeles, CA"
+
+
+def test_unknown_location_is_tidied():
+    assert normalize_location("Portland ,OR ") == "Portland, OR"
+
+
+def test_canonical_query_shares_keys_across_spellings():
+    assert canonical_query("Sr. Front-End Devs", "NYC") == canonical_query("Frontend Developer", "New York, NY")
+    assert canonical_query("Product Designer", "SF") != canonical_query("UI/UX Designer", "SF")
@@ -0,0 +1,81 @@
+from backend.services.resume_dedup import NearDuplicateIndex, estimated_jaccard, minhash_signature
+
+RESUME = "\n".join([
+    "Jane Doe, backend engineer with 7 years of experience",
+    "Skills: python, fastapi, postgresql, docker, kubernetes, terraform",
+    "Built a payments platform handling 2 million requests per day",
+    "Led migration of monolith services to event driven microservices",
+    "Mentored four junior engineers and ran weekly design reviews",
+    "Reduced cloud spend by 30 percent through autoscaling and caching",
+    "Education: BSc computer science, state university, 2016",
+])
+EDITED = RESUME.replace("2 million", "3 million")
+OTHER = "\n".join([
+    "John Roe, registered nurse in a busy emergency department",
+    "Triage, medication administration, wound care and patient education",
+    "Coordinated care plans with physicians and social workers",
+])
+
+
+def _index(**kwargs):
+    return NearDuplicateIndex(**{"threshold": 0.8, "per_user": 3, "max_users": 10, **kwargs})
+
+
+def test_signature_is_stable_and_ignores_line_order():
+    lines = RESUME.splitlines()
+    assert minhash_signature(RESUME) == minhash_signature("\n".join(reversed(lines)))
+    assert estimated_jaccard(minhash_signature(RESUME), minhash_signature(EDITED)) >= 0.8
+
+
+def test_near_identical_resume_hits_and_different_one_misses():
+    index = _index()
+    index.add("u1", minhash_signature(RESUME), {"skills": {"v": 1}})
+    assert index.lookup("u1", minhash_signature(EDITED)) == {"skills": {"v": 1}}
+    assert index.lookup("u1", minhash_signature(OTHER)) is None
+
+
+def test_users_are_isolated():
+    index = _index()
+    index.add("u1", minhash_signature(RESUME), {"skills": {"v": 1}})
+    assert index.lookup("u2", minhash_signature(RESUME)) is None
+
+
+def test_per_user_and_user_eviction():
+    index = _index(per_user=1, max_users=2)
+    index.add("u1", minhash_signature(RESUME), {"v": "old"})
+    index.add("u1", minhash_signature(OTHER), {"v": "new"})
+    assert index.lookup("u1", minhash_signature(RESUME)) is None
+    assert index.lookup("u1", minhash_signature(OTHER)) == {"v": "new"}
+    index.add("u2", minhash_signature(OTHER), {"v": 2})
+    index.add("u3", minhash_signature(OTHER), {"v": 3})
+    # u1 was least recently used
+    assert "u1" not in index._users
+    assert all(user != "u1" for user, _, _ in index._buckets)
+
+
+def test_warm_does_not_overwrite_entry_added_meanwhile(monkeypatch):
+    index = _index(per_user=1)
+    stored = {"minhash": minhash_signature(OTHER), "sections": {"v": "stored"}}
+
+    def slow_load(user_id):
+        # an upload for the same user lands while the history is being read
+        index.add(user_id, minhash_signature(RESUME), {"v": "fresh"})
+        return [stored]
+
+    monkeypatch.setattr(index, "_load", slow_load)
+    assert index.lookup("u1", minhash_signature(RESUME)) == {"v": "fresh"}
+    assert index.lookup("u1", minhash_signature(OTHER)) is None
+
+
+def test_warm_loads_history_once(monkeypatch):
+    index = _index()
+    loads = []
+
+    def load(user_id):
+        loads.append(user_id)
+        return [{"minhash": minhash_signature(RESUME), "sections": {"v": "stored"}}]
+
+    monkeypatch.setattr(index, "_load", load)
+    assert index.lookup("u1", minhash_signature(EDITED)) == {"v": "stored"}
+    index.lookup("u1", minhash_signature(OTHER))
+    assert loads == ["u1"]
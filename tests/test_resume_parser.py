@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from backend.services.resume_parser import (
+    _EXTRACTOR, analyze_resume_text, extract_skills, iter_resume_analyses, segment_sections,
+)
+from tests.resume_fixtures import make_resume
+
+
+def _sectioned_resume(seed: int) -> str:
+    rng = random.Random(seed)
+    parts = [f"Jane Doe\nBackend engineer with {rng.randint(1, 20)} years of experience"]
+    for heading in ("Summary", "Skills", "Experience", "Projects", "Education", "Interests"):
+        body, _ = make_resume(rng.randint(200, 1200), rng)
+        parts.append(f"{heading}\n{body}")
+    return "\n".join(parts)
+
+
+FIXTURES = [_sectioned_resume(seed) for seed in range(12)] + [make_resume(2000, random.Random(99))[0]]
+
+
+def test_sections_are_found():
+    sections = segment_sections(FIXTURES[0])
+    assert {"header", "skills", "experience", "projects", "education", "other"} <= set(sections)
+
+
+@pytest.mark.parametrize("text", FIXTURES)
+def test_single_and_incremental_agree(text):
+    analysis, records, reused = _EXTRACTOR.extract_incremental(text)
+    assert reused == 0
+    assert _EXTRACTOR.extract(text) == analysis
+
+
+def test_batch_matches_single_resume_analysis():
+    streamed = dict(iter_resume_analyses(FIXTURES, chunk_size=5))
+    assert [streamed[i] for i in range(len(FIXTURES))] == [analyze_resume_text(text) for text in FIXTURES]
+    assert [streamed[i]["skills"] for i in range(len(FIXTURES))] == [extract_skills(text) for text in FIXTURES]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_reuse_matches_fresh_analysis(seed):
+    text = _sectioned_resume(seed)
+    _, records, _ = _EXTRACTOR.extract_incremental(text)
+    edited = text.replace("Projects\n", "Projects\nbuilt a kubernetes operator in golang\n")
+    analysis, _, reused = _EXTRACTOR.extract_incremental(edited, records)
+    assert reused == len(records) - 1
+    assert analysis == _EXTRACTOR.extract(edited)
+
+
+class _FakeNlp:
+    """Stands in for spaCy: lemmatizes by whitespace split and counts passes."""
+
+    def __init__(self):
+        self.passes = 0
+        self.texts = 0
+
+    def pipe(self, texts, batch_size=None, n_process=None):
+        self.passes += 1
+        for text in texts:
+            self.texts += 1
+            yield [type("Token", (), {"lemma_": w})() for w in text.split()]
+
+
+def test_each_section_is_lemmatized_once_in_one_pass(monkeypatch):
+    from backend.services import resume_parser
+
+    nlp = _FakeNlp()
+    monkeypatch.setattr(resume_parser, "_get_nlp", lambda: nlp)
+    text = FIXTURES[0]
+    resume_parser.extract_skills(text)
+    assert nlp.passes == 1
+    assert nlp.texts == len(segment_sections(text))
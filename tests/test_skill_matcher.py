@@ -0,0 +1,34 @@
+from backend.services.skill_matcher import KeywordAutomaton, TrigramIndex, build_skill_matcher
+
+
+def test_whole_word_matches_respect_token_boundaries():
+    matcher = build_skill_matcher(["java", "c", "c++", "node.js", "machine learning"])
+    assert matcher.find_all("javascript and c++ developer") == {"c++"}
+    assert matcher.find_all("java, c and node.js.") == {"java", "c", "node.js"}
+    assert matcher.find_all("python.") == set()
+    assert matcher.find_all("applied machine learning daily") == {"machine learning"}
+
+
+def test_sentence_dot_is_not_part_of_a_token():
+    matcher = build_skill_matcher(["python", "asp.net"])
+    assert matcher.find_all("built apis in python. also asp.net") == {"python", "asp.net"}
+
+
+def test_substring_phrases_match_inside_words():
+    automaton = KeywordAutomaton()
+    automaton.add("ml", "role-kw", whole_word=False)
+    automaton.add("html")
+    assert automaton.find_all("html5 and mlops") == {"role-kw"}
+    assert automaton.find_all("html and mlops") == {"role-kw", "html"}
+
+
+def test_overlapping_phrases_are_all_reported():
+    matcher = build_skill_matcher(["data", "data analysis", "analysis"])
+    assert matcher.find_all("data analysis") == {"data", "data analysis", "analysis"}
+
+
+def test_trigram_index_scores_typos_and_skips_exact():
+    index = TrigramIndex(["kubernetes", "tensorflow", "go"])
+    assert set(index.match("deployed on kubernets clusters", threshold=80)) == {"kubernetes"}
+    assert index.match("kubernetes", threshold=80, exclude={"kubernetes"}) == {}
+    assert index.match("go", threshold=80) == {}
@@ -0,0 +1,58 @@
+from backend.services.trend_matrix import TrendMatrix
+
+VOCAB = ["python", "sql", "docker", "aws", "react"]
+POSTINGS = [
+    ({"python", "sql", "docker"}, "Austin, TX"),
+    ({"python", "sql"}, "Austin, TX"),
+    ({"python", "aws"}, "Seattle, WA"),
+    ({"docker", "aws", "unknown skill"}, "Austin, TX"),
+    ({"sql"}, ""),
+]
+
+
+def _matrix(postings=POSTINGS):
+    return TrendMatrix.from_skill_sets([s for s, _ in postings], VOCAB, locations=[l for _, l in postings])
+
+
+def test_top_skills_rank_by_posting_count():
+    top = _matrix().top_skills()
+    assert [(s["name"], s["job_count"]) for s in top] == [
+        ("Python", 3), ("Sql", 3), ("Docker", 2), ("Aws", 2),
+    ]
+    assert top[0]["importance"] == 1.0
+    assert top[2]["importance"] == round(2 / 3, 3)
+    assert len(_matrix().top_skills(limit=2)) == 2
+
+
+def test_skills_outside_vocabulary_are_ignored():
+    matrix = _matrix()
+    assert matrix.n_postings == len(POSTINGS)
+    assert matrix.document_frequency().tolist() == [3, 3, 2, 2, 0]
+
+
+def test_cooccurrence_counts_shared_postings():
+    pairs = _matrix().cooccurrence(["python", "react", "not in vocab"])
+    assert list(pairs) == ["Python"]
+    assert pairs["Python"] == [
+        {"name": "Sql", "job_count": 2, "share": round(2 / 3, 3)},
+        {"name": "Docker", "job_count": 1, "share": round(1 / 3, 3)},
+        {"name": "Aws", "job_count": 1, "share": round(1 / 3, 3)},
+    ]
+    assert set(_matrix().cooccurrence()) == {"Python", "Sql", "Docker", "Aws"}
+
+
+def test_by_location_busiest_first_and_skips_blank():
+    leaders = _matrix().by_location(limit=2)
+    assert list(leaders) == ["Austin, TX", "Seattle, WA"]
+    # ties keep vocabulary order
+    assert leaders["Austin, TX"] == ["Python", "Sql"]
+    assert leaders["Seattle, WA"] == ["Python", "Aws"]
+    assert list(_matrix().by_location(max_locations=1)) == ["Austin, TX"]
+
+
+def test_empty_corpus():
+    matrix = _matrix([])
+    assert matrix.n_postings == 0
+    assert matrix.top_skills() == []
+    assert matrix.cooccurrence() == {}
+    assert matrix.by_location() == {}
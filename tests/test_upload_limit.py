@@ -0,0 +1,60 @@
+import asyncio
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from backend.services.pdf_ingestion import MULTIPART_OVERHEAD_BYTES, UploadSizeLimitMiddleware
+
+LIMIT = 1024
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, paths=["/upload"], max_bytes=LIMIT)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @app.post("/other")
+    async def other(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    return app
+
+
+def test_declared_oversized_body_is_refused():
+    client = TestClient(_app())
+    big = b"x" * (LIMIT + MULTIPART_OVERHEAD_BYTES + 1)
+    assert client.post("/upload", files={"file": ("a.pdf", b"x" * LIMIT)}).json() == {"size": LIMIT}
+    assert client.post("/upload", files={"file": ("a.pdf", big)}).status_code == 413
+    assert client.post("/other", files={"file": ("a.pdf", big)}).status_code == 200
+
+
+def test_streamed_body_is_cut_off_while_received():
+    reads = []
+    head = (b'--xyz\r\nContent-Disposition: form-data; name="file"; filename="a.pdf"\r\n'
+            b"Content-Type: application/pdf\r\n\r\n")
+    chunk = b"x" * 16 * 1024
+
+    async def receive():
+        # a chunked upload that never ends
+        body = chunk if reads else head
+        reads.append(len(body))
+        return {"type": "http.request", "body": body, "more_body": True}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "method": "POST", "path": "/upload", "raw_path": b"/upload", "root_path": "",
+        "scheme": "http", "query_string": b"", "server": ("test", 80), "client": ("test", 1),
+        "http_version": "1.1", "app": None,
+        "headers": [(b"content-type", b"multipart/form-data; boundary=xyz")],
+    }
+    asyncio.run(_app()(scope, receive, send))
+    assert sent[0]["type"] == "http.response.start" and sent[0]["status"] == 413
+    # stopped right after passing the limit instead of reading forever
+    assert sum(reads) <= LIMIT + MULTIPART_OVERHEAD_BYTES + len(chunk)
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.services.worker_pool import BoundedProcessPool, PoolSaturated
+
+
+@pytest.fixture
+def pool():
+    pool = BoundedProcessPool(max_workers=1, max_queue=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_saturated_pool_fails_fast(pool):
+    async def scenario():
+        first = asyncio.create_task(pool.run(time.sleep, 0.5))
+        second = asyncio.create_task(pool.run(time.sleep, 0.1))
+        await asyncio.sleep(0)
+        assert pool.inflight == 2
+        with pytest.raises(PoolSaturated):
+            await pool.run(time.sleep, 0)
+        await asyncio.gather(first, second)
+        assert pool.inflight == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_caller_keeps_slot_until_job_finishes(pool):
+    async def scenario():
+        await pool.run(time.sleep, 0)  # start the worker process
+        running = asyncio.create_task(pool.run(time.sleep, 0.5))
+        queued = asyncio.create_task(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0.2)
+        running.cancel()
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        # jobs already handed to the worker keep their slots after the callers are gone
+        assert pool.inflight >= 1
+        start = time.monotonic()
+        while pool.inflight:
+            await asyncio.sleep(0.02)
+        assert time.monotonic() - start > 0.1
+
+    asyncio.run(scenario())